@@ -132,7 +132,8 @@ class FluidraHeatPumpClimate(FluidraPoolControlEntity, ClimateEntity):
         if self._pending_temperature is not None:
             confirmed = actual_temp is not None and abs(actual_temp - self._pending_temperature) < 0.05
             expired = (
-                self._last_action_time is not None and time.time() - self._last_action_time > CLIMATE_OPTIMISTIC_TIMEOUT
+                self._last_action_time is not None
+                and time.monotonic() - self._last_action_time > CLIMATE_OPTIMISTIC_TIMEOUT
             )
             if confirmed or expired:
                 self._pending_temperature = None
@@ -195,7 +196,7 @@ class FluidraHeatPumpClimate(FluidraPoolControlEntity, ClimateEntity):
         # Check for pending optimistic preset mode first
         if self._pending_preset_mode is not None and self._last_preset_action_time is not None:
             # Clear pending mode after 5 seconds
-            if time.time() - self._last_preset_action_time > CLIMATE_OPTIMISTIC_TIMEOUT:
+            if time.monotonic() - self._last_preset_action_time > CLIMATE_OPTIMISTIC_TIMEOUT:
                 self._pending_preset_mode = None
                 self._last_preset_action_time = None
             else:
@@ -227,7 +228,7 @@ class FluidraHeatPumpClimate(FluidraPoolControlEntity, ClimateEntity):
 
         # Check for pending optimistic HVAC mode first
         if self._pending_hvac_mode is not None and self._last_hvac_action_time is not None:
-            if time.time() - self._last_hvac_action_time > CLIMATE_OPTIMISTIC_TIMEOUT:
+            if time.monotonic() - self._last_hvac_action_time > CLIMATE_OPTIMISTIC_TIMEOUT:
                 self._pending_hvac_mode = None
                 self._last_hvac_action_time = None
             else:
@@ -280,7 +281,7 @@ class FluidraHeatPumpClimate(FluidraPoolControlEntity, ClimateEntity):
             # Optimistic update - show immediately in UI
 
             self._pending_hvac_mode = hvac_mode
-            self._last_hvac_action_time = time.time()
+            self._last_hvac_action_time = time.monotonic()
             self.async_write_ha_state()
 
             behavior = resolve_behavior(self.device_data)
@@ -361,7 +362,7 @@ class FluidraHeatPumpClimate(FluidraPoolControlEntity, ClimateEntity):
             # Mise à jour optimiste immédiate
 
             self._pending_temperature = temperature
-            self._last_action_time = time.time()
+            self._last_action_time = time.monotonic()
             self.async_write_ha_state()
 
             # Ici il faudrait implémenter la méthode pour définir la température
@@ -412,7 +413,7 @@ class FluidraHeatPumpClimate(FluidraPoolControlEntity, ClimateEntity):
             # Optimistic update - show immediately in UI
 
             self._pending_preset_mode = preset_mode
-            self._last_preset_action_time = time.time()
+            self._last_preset_action_time = time.monotonic()
             self.async_write_ha_state()
 
             success = False
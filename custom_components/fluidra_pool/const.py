@@ -146,6 +146,9 @@ COMPONENT_SCHEDULE: Final = 20
 COMPONENT_LIGHT_COLOR: Final = 45
 COMPONENT_DM24049704_SCHEDULE: Final = 258
 
+# Pumps expose eight schedule slots on COMPONENT_SCHEDULE.
+PUMP_SCHEDULE_IDS: Final = ("1", "2", "3", "4", "5", "6", "7", "8")
+
 # Pump speed mapping: API level → displayed percentage
 PUMP_SPEED_PERCENTAGES: Final[dict[int, int]] = {
     0: 45,  # Low
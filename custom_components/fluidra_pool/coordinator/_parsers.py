@@ -13,7 +13,7 @@ from typing import Any
 from homeassistant.util import dt as dt_util
 
 from ..const import PUMP_SPEED_PERCENTAGES
-from ..helpers import parse_cron_time
+from ..helpers import parse_cron_time, schedule_operation_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -184,8 +184,7 @@ def calculate_auto_speed_from_schedules(device: dict[str, Any]) -> int:
                 in_window = current_time >= start_time_obj or current_time <= end_time_obj
 
             if in_window:
-                operation = schedule.get("startActions", {}).get("operationName", "0")
-                return _OPERATION_TO_PERCENT.get(operation, 0)
+                return _OPERATION_TO_PERCENT.get(schedule_operation_name(schedule), 0)
 
         return 0
 
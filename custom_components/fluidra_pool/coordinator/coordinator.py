@@ -37,7 +37,7 @@ from ..const import (
 )
 from ..device_registry import DeviceIdentifier
 from ..fluidra_api import FluidraPoolAPI
-from ..helpers import determine_pool_access, resolve_schedule_component
+from ..helpers import determine_pool_access, index_devices, index_schedules, resolve_schedule_component
 from ..repairs import (
     async_create_connection_issue,
     async_create_unverified_profile_issue,
@@ -500,14 +500,12 @@ class FluidraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if device_type == DEVICE_TYPE_CHLORINATOR:
                 # EXO chlorinators expose schedules (list) on component 20.
                 if isinstance(reported_value, list):
-                    device["schedule_data"] = reported_value
-                    self._track_schedule_count(pool_id, device_id, reported_value)
+                    self._store_schedule_data(device, pool_id, device_id, reported_value)
                 elif isinstance(reported_value, int):
                     device["mode_reported"] = reported_value
             else:
                 schedule_data = reported_value if isinstance(reported_value, list) else []
-                device["schedule_data"] = schedule_data
-                self._track_schedule_count(pool_id, device_id, schedule_data)
+                self._store_schedule_data(device, pool_id, device_id, schedule_data)
         elif component_id == 21:
             device["network_status_component"] = reported_value
             if DeviceIdentifier.has_feature(device, "z550_mode"):
@@ -539,8 +537,7 @@ class FluidraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 device_type = config.device_type if config else device.get("type", "")
                 if device_type == DEVICE_TYPE_LIGHT:
                     schedule_data = reported_value if isinstance(reported_value, list) else []
-                    device["schedule_data"] = schedule_data
-                    self._track_schedule_count(pool_id, device_id, schedule_data)
+                    self._store_schedule_data(device, pool_id, device_id, schedule_data)
         elif component_id == 48 and DeviceIdentifier.has_feature(device, "z650iq_mode"):
             device["component_48_data"] = component_state
             # Instantaneous power draw in Watts. Not meter-verified — see the
@@ -653,8 +650,7 @@ class FluidraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     schedule_data = reported_value
                 else:
                     schedule_data = []
-                device["schedule_data"] = schedule_data
-                self._track_schedule_count(pool_id, device_id, schedule_data)
+                self._store_schedule_data(device, pool_id, device_id, schedule_data)
             device[f"component_{component_id}_data"] = component_state
 
     def _apply_resolved_schedule(self, device: dict[str, Any], pool_id: str, device_id: str) -> None:
@@ -676,9 +672,8 @@ class FluidraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             schedule_data = []
 
-        device["schedule_data"] = schedule_data
+        self._store_schedule_data(device, pool_id, device_id, schedule_data)
         device["schedule_component_resolved"] = component_id
-        self._track_schedule_count(pool_id, device_id, schedule_data)
 
     def _process_victoria_component(
         self, device: dict[str, Any], component_id: int, component_state: dict[str, Any]
@@ -810,6 +805,28 @@ class FluidraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if num is not None:
                 device["pump_quick_function_expiry"] = int(num) or None
 
+    def _store_schedule_data(
+        self, device: dict[str, Any], pool_id: str, device_id: str, schedule_data: list[dict[str, Any]]
+    ) -> None:
+        """Set the device's schedules together with their by-id lookup index.
+
+        Every schedule entity resolves its slot on each state read, so the index
+        is built once per poll here instead of being rescanned per entity.
+        """
+        device["schedule_data"] = schedule_data
+        device["_schedules_by_id"] = index_schedules(schedule_data)
+        self._track_schedule_count(pool_id, device_id, schedule_data)
+
+    def _index_pools(self, pools: list[dict[str, Any]]) -> dict[str, Any]:
+        """Key pools by id and attach each pool's ``_devices_by_id`` lookup index.
+
+        Entities resolve their device on every property read; the index turns
+        that per-read scan of the device list into a dict lookup.
+        """
+        for pool in pools:
+            pool["_devices_by_id"] = index_devices(pool.get("devices", []))
+        return {pool["id"]: pool for pool in pools}
+
     def _track_schedule_count(self, pool_id: str, device_id: str, schedule_data: list[dict[str, Any]]) -> None:
         """Track schedule count changes for cleanup."""
         device_key = f"{pool_id}_{device_id}"
@@ -875,7 +892,7 @@ class FluidraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if self._first_update:
                 self._first_update = False
                 self._handle_update_success()
-                return {pool["id"]: pool for pool in pools}
+                return self._index_pools(pools)
 
             previous_data = self.data if isinstance(self.data, dict) else {}
 
@@ -920,7 +937,7 @@ class FluidraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._handle_update_success()
                 self._sync_device_firmware(pools)
 
-            return {pool["id"]: pool for pool in pools}
+            return self._index_pools(pools)
 
         except ConfigEntryAuthFailed:
             raise
@@ -6,6 +6,7 @@ differences across the CC/LC/DM/NS lineups.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any
 
 from ..types import DeviceConfig
@@ -1081,4 +1082,4 @@ CHLORINATOR_CONFIGS: dict[str, DeviceConfig] = {
 
 # Signature-only profile: strip every pattern so it can never win pattern/priority
 # scoring; identifier.py hands it out solely via the tecnoLC2 component signature.
-CHLORINATOR_CONFIGS["tecnolc2_signature"].family_patterns = []
+CHLORINATOR_CONFIGS["tecnolc2_signature"] = replace(CHLORINATOR_CONFIGS["tecnolc2_signature"], family_patterns=[])
@@ -4,34 +4,91 @@ from __future__ import annotations
 
 from functools import lru_cache
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .configs import DEVICE_CONFIGS
 from .types import DeviceConfig
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-@lru_cache(maxsize=1024)
-def _compile_wildcard_pattern(pattern_lower: str) -> re.Pattern[str]:
-    """Compile a wildcard pattern (``*`` supported) into a case-insensitive regex."""
-    regex = re.escape(pattern_lower).replace(r"\*", ".*")
-    return re.compile(f"^{regex}$")
 
+@lru_cache(maxsize=1024)
+def _compile_wildcard_pattern(pattern_lower: str) -> Callable[[str], bool]:
+    """Compile a wildcard pattern (``*`` supported) into a matcher for a lowercased value.
 
-def _match(value: str, patterns: tuple[str, ...]) -> bool:
+    The shapes the device configs actually use (``LG*``, ``*LG``, ``*.nn_*``) map
+    straight onto ``startswith``/``endswith``/``in``; only a ``*`` between
+    literal text falls back to a regex.
+    """
+    inner = pattern_lower.strip("*")
+    if "*" not in inner:
+        leading = pattern_lower.startswith("*")
+        trailing = pattern_lower.endswith("*")
+        if leading and trailing:
+            return lambda value: inner in value
+        if trailing:
+            return lambda value: value.startswith(inner)
+        if leading:
+            return lambda value: value.endswith(inner)
+    regex = re.compile("^" + re.escape(pattern_lower).replace(r"\*", ".*") + "$")
+    return lambda value: regex.match(value) is not None
+
+
+def _match(value: str, patterns: tuple[str, ...] | list[str]) -> bool:
     """Pure-function equivalent of ``DeviceIdentifier._matches_pattern`` for caching."""
-    if not value or not patterns:
+    if not value:
+        return False
+    return _match_lower(value.lower(), patterns)
+
+
+def _match_lower(value_lower: str, patterns: tuple[str, ...] | list[str]) -> bool:
+    """:func:`_match` for a value the caller has already lowercased."""
+    if not value_lower or not patterns:
         return False
-    value_lower = value.lower()
     for pattern in patterns:
         pattern_lower = pattern.lower()
         if "*" in pattern_lower:
-            if _compile_wildcard_pattern(pattern_lower).match(value_lower):
+            if _compile_wildcard_pattern(pattern_lower)(value_lower):
                 return True
         elif pattern_lower in value_lower:
             return True
     return False
 
 
+def _compile_patterns(patterns: list[str] | tuple[str, ...]) -> tuple[Callable[[str], bool], ...]:
+    """Turn a config pattern list into matchers for a lowercased value (see :func:`_match_lower`)."""
+    matchers: list[Callable[[str], bool]] = []
+    for pattern in patterns:
+        pattern_lower = pattern.lower()
+        if "*" in pattern_lower:
+            matchers.append(_compile_wildcard_pattern(pattern_lower))
+        else:
+            # Substring of the value, not the other way round.
+            matchers.append(lambda value, needle=pattern_lower: needle in value)
+    return tuple(matchers)
+
+
+def _matches_any(value_lower: str, matchers: tuple[Callable[[str], bool], ...]) -> bool:
+    """Return True if ``value_lower`` is non-empty and any compiled matcher accepts it."""
+    return bool(value_lower) and any(matcher(value_lower) for matcher in matchers)
+
+
+# DEVICE_CONFIGS is static: order it by priority and compile every pattern list
+# once at import instead of on each identification.
+_PREPARED_CONFIGS = tuple(
+    (
+        name,
+        config,
+        _compile_patterns(config.identifier_patterns),
+        _compile_patterns(config.name_patterns),
+        _compile_patterns(config.family_patterns),
+        _compile_patterns(config.model_patterns),
+    )
+    for name, config in sorted(DEVICE_CONFIGS.items(), key=lambda x: x[1].priority, reverse=True)
+)
+
+
 # tecnoLC2 water temperature (c172, °C × 10) realistically spans ~3-52 °C. A genuine
 # domoticS2 pH on c172 reads 600-850 (6.0-8.5 pH), so a c172 in this lower band cannot
 # be a pH value — it is a temperature, i.e. the device is tecnoLC2.
@@ -71,8 +128,6 @@ def _identify_device_uncached(
     comp7_value: str,
 ) -> DeviceConfig | None:
     """Resolve a :class:`DeviceConfig` from hashable primitives so lru_cache can memoise."""
-    sorted_configs = sorted(DEVICE_CONFIGS.items(), key=lambda x: x[1].priority, reverse=True)
-
     best_match: DeviceConfig | None = None
     best_score = 0
     # Did the winning config match on a real device signal (id/name/family/model/
@@ -80,16 +135,22 @@ def _identify_device_uncached(
     # scores exactly 10 and must still fall through to the generic config.
     best_has_signal = False
 
-    for config_name, config in sorted_configs:
+    # Lowercase each field once instead of once per config and pattern list.
+    device_id_lower = device_id.lower()
+    device_name_lower = device_name.lower()
+    family_lower = family.lower()
+    model_lower = model.lower()
+
+    for config_name, config, id_matchers, name_matchers, family_matchers, model_matchers in _PREPARED_CONFIGS:
         signal = 0
 
-        if _match(device_id, tuple(config.identifier_patterns)):
+        if _matches_any(device_id_lower, id_matchers):
             signal += 50
-        if _match(device_name, tuple(config.name_patterns)):
+        if _matches_any(device_name_lower, name_matchers):
             signal += 30
-        if _match(family, tuple(config.family_patterns)):
+        if _matches_any(family_lower, family_matchers):
             signal += 20
-        if _match(model, tuple(config.model_patterns)):
+        if _matches_any(model_lower, model_matchers):
             signal += 20
 
         score = signal
@@ -152,31 +213,20 @@ class DeviceIdentifier:
     @staticmethod
     def _matches_pattern(value: str, patterns: list[str] | tuple[str, ...]) -> bool:
         """Check if value matches any pattern (supports ``*`` wildcard)."""
-        if not value or not patterns:
+        if not value:
             return False
-
-        value_lower = value.lower()
-        for pattern in patterns:
-            pattern_lower = pattern.lower()
-            if "*" in pattern_lower:
-                if _compile_wildcard_pattern(pattern_lower).match(value_lower):
-                    return True
-            elif pattern_lower in value_lower:
-                return True
-        return False
+        return _match_lower(value.lower(), patterns)
 
     @staticmethod
     def _check_component_signature(device: dict[str, Any], component_id: int, value_patterns: list[str]) -> bool:
         """Check if a specific component contains expected values."""
-        try:
-            components = device.get("components", {})
-            if isinstance(components, dict) and str(component_id) in components:
-                component = components[str(component_id)]
-                reported_value = str(component.get("reportedValue", ""))
-                return DeviceIdentifier._matches_pattern(reported_value, value_patterns)
-        except (AttributeError, TypeError):
-            pass
-        return False
+        components = device.get("components") if isinstance(device, dict) else None
+        if not isinstance(components, dict):
+            return False
+        component = components.get(str(component_id))
+        if not isinstance(component, dict):
+            return False
+        return _match(str(component.get("reportedValue", "")), value_patterns)
 
     @staticmethod
     def identify_device(device: dict[str, Any]) -> DeviceConfig | None:
@@ -135,6 +135,9 @@ def _redact_pools_data(pools_data: dict[str, Any]) -> dict[str, Any]:
                     redacted_pool[key] = REDACTED
                 elif key == "devices":
                     redacted_pool["devices"] = _redact_devices_data(value)
+                elif key == "_devices_by_id":
+                    # Lookup index over "devices" keyed by raw device serials.
+                    continue
                 elif key == "water_quality":
                     # Water-quality telemetry is useful for debugging algorithms.
                     redacted_pool[key] = value
@@ -166,6 +169,9 @@ def _redact_devices_data(devices: list[dict[str, Any]]) -> list[dict[str, Any]]:
             for key, value in device.items():
                 if key.lower() in TO_REDACT_LOWER:
                     redacted_device[key] = REDACTED
+                elif key == "_schedules_by_id":
+                    # Lookup index over "schedule_data"; dumping it would duplicate every slot.
+                    continue
                 elif key == "components":
                     redacted_device["components"] = {
                         str(comp_id): _redact_component_data(comp_id, comp_data)
@@ -9,6 +9,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DEVICE_MODEL_FALLBACK, DEVICE_MODEL_MAP, DOMAIN
+from .device_registry import DeviceIdentifier
 
 if TYPE_CHECKING:
     from .coordinator import FluidraDataUpdateCoordinator
@@ -30,6 +31,11 @@ class FluidraPoolEntity(CoordinatorEntity):
         super().__init__(coordinator)
         self._pool_id = pool_id
         self._device_id = device_id
+        # Last resolved device and the coordinator snapshot it came from. Every
+        # poll returns a fresh ``coordinator.data`` dict, so identity is enough
+        # to tell when the lookup must be redone.
+        self._cached_data: dict[str, Any] | None = None
+        self._cached_device: dict[str, Any] = {}
 
     @property
     def device_data(self) -> dict[str, Any]:
@@ -37,14 +43,29 @@ class FluidraPoolEntity(CoordinatorEntity):
         data = self.coordinator.data
         if data is None:
             return {}
+        if data is self._cached_data:
+            return self._cached_device
         pool: dict[str, Any] | None = data.get(self._pool_id)
         if pool:
-            devices: list[dict[str, Any]] = pool.get("devices", [])
-            for device in devices:
-                if device.get("device_id") == self._device_id:
-                    return device
+            device = self._find_device(pool)
+            if device is not None:
+                self._cached_data = data
+                self._cached_device = device
+                return device
         return {}
 
+    def _find_device(self, pool: dict[str, Any]) -> dict[str, Any] | None:
+        """Return this entity's device dict from ``pool``, or None if absent."""
+        index: dict[str, dict[str, Any]] | None = pool.get("_devices_by_id")
+        if index is not None and (device := index.get(self._device_id)) is not None:
+            return device
+        # Pools built outside the coordinator carry no index.
+        devices: list[dict[str, Any]] = pool.get("devices", [])
+        for device in devices:
+            if device.get("device_id") == self._device_id:
+                return device
+        return None
+
     @property
     def pool_data(self) -> dict[str, Any]:
         """Get pool data from coordinator."""
@@ -57,8 +78,6 @@ class FluidraPoolEntity(CoordinatorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info using device registry for consistent naming."""
-        from .device_registry import DeviceIdentifier
-
         device_data = self.device_data
         config = DeviceIdentifier.identify_device(device_data)
 
@@ -88,8 +107,11 @@ class FluidraPoolEntity(CoordinatorEntity):
         connectivity info (first poll after startup, devices whose status
         carries no ``connectivity.connected``) must not read as offline.
         """
+        if not self.coordinator.last_update_success:
+            # Skip the device lookup entirely while the coordinator is failing.
+            return False
         device_data = self.device_data
-        return self.coordinator.last_update_success and bool(device_data) and device_data.get("online") is not False
+        return bool(device_data) and device_data.get("online") is not False
 
 
 class FluidraPoolControlEntity(FluidraPoolEntity):
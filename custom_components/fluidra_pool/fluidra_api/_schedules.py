@@ -8,6 +8,7 @@ from urllib.parse import quote
 
 from ..api_resilience import FluidraAuthError, FluidraError
 from ..const import COMPONENT_DM24049704_SCHEDULE, COMPONENT_SCHEDULE
+from ..helpers import schedule_operation_name
 from ..utils import CRON_DAY_TO_NAME, extract_cron_days
 from ._base import FluidraAPIBase
 from ._constants import CONNECTED_PARAMS, FLUIDRA_EMEA_BASE
@@ -41,7 +42,7 @@ class SchedulesMixin(FluidraAPIBase):
 
             start_cron = sched.get("startTime", "")
             end_cron = sched.get("endTime", "")
-            operation = sched.get("startActions", {}).get("operationName", "1")
+            operation = schedule_operation_name(sched, "1")
 
             start_parts = start_cron.split() if start_cron else []
             end_parts = end_cron.split() if end_cron else []
@@ -8,6 +8,7 @@ introducing coupling between platforms.
 from __future__ import annotations
 
 from datetime import time
+from functools import lru_cache
 from typing import Any
 
 
@@ -46,29 +47,79 @@ def resolve_schedule_component(device_data: dict[str, Any], default: int = 20) -
     return int(mapping["none"])
 
 
+def index_schedules(schedules: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Map each schedule's ``id`` (as a string) to its entry.
+
+    The API mixes int/str ids, so keys are normalised once here instead of on
+    every lookup. On duplicate ids the first entry wins, like a linear scan.
+    Malformed (non-dict) entries are skipped rather than failing the poll.
+    """
+    index: dict[str, dict[str, Any]] = {}
+    for schedule in schedules:
+        if isinstance(schedule, dict):
+            index.setdefault(str(schedule.get("id")), schedule)
+    return index
+
+
+def index_devices(devices: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Map each device's ``device_id`` to its dict.
+
+    Entities resolve their device on every property read, so the coordinator
+    builds this once per poll. Devices without an id are skipped; on duplicate
+    ids the first entry wins, like a linear scan.
+    """
+    index: dict[str, dict[str, Any]] = {}
+    for device in devices:
+        if isinstance(device, dict) and (device_id := device.get("device_id")):
+            index.setdefault(device_id, device)
+    return index
+
+
 def get_schedule_data(device_data: dict[str, Any], schedule_id: Any) -> dict[str, Any] | None:
     """Return the schedule dict matching ``schedule_id`` in ``device_data``.
 
     Looks up ``device_data["schedule_data"]`` for an entry whose ``id`` matches
     ``schedule_id`` (compared as strings, since the API mixes int/str ids).
     Returns ``None`` if ``device_data`` is empty, has no schedules, or no
-    schedule matches.
+    schedule matches. Malformed payloads (non-dict device data, a non-list
+    ``schedule_data``, non-dict entries) are treated as "no schedule" instead
+    of raising, so entity properties can call this without a try/except.
+
+    Uses the ``_schedules_by_id`` index the coordinator stores next to
+    ``schedule_data`` when present; device dicts built elsewhere fall back to a
+    linear scan.
     """
-    if not device_data:
+    if not device_data or not isinstance(device_data, dict):
         return None
 
     schedules = device_data.get("schedule_data")
-    if not schedules:
+    if not schedules or not isinstance(schedules, list):
         return None
 
+    index = device_data.get("_schedules_by_id")
+    if isinstance(index, dict):
+        return index.get(str(schedule_id))
+
     for schedule in schedules:
-        if str(schedule.get("id")) == str(schedule_id):
+        if isinstance(schedule, dict) and str(schedule.get("id")) == str(schedule_id):
             result: dict[str, Any] = schedule
             return result
 
     return None
 
 
+def schedule_operation_name(schedule: dict[str, Any], default: str = "0") -> str:
+    """Return ``schedule["startActions"]["operationName"]`` as a string.
+
+    Called for every entry each time a schedule payload is rebuilt, so it avoids
+    allocating a throwaway ``{}`` for the missing-key case and skips ``str()``
+    when the API already sent a string.
+    """
+    start_actions = schedule.get("startActions")
+    operation = start_actions.get("operationName", default) if start_actions else default
+    return operation if type(operation) is str else str(operation)
+
+
 def resolve_component_rw(cfg: int | dict[str, Any]) -> tuple[Any, Any]:
     """Resolve a component config that may be a plain int or a read/write dict.
 
@@ -91,8 +142,16 @@ def parse_cron_time(cron_time: str) -> time | None:
     Returns ``None`` for anything that does not carry a valid minute/hour pair
     (short string, non-numeric fields, out-of-range values, non-string input).
     """
+    if not isinstance(cron_time, str):
+        return None
+    return _parse_cron_time_str(cron_time)
+
+
+@lru_cache(maxsize=128)
+def _parse_cron_time_str(cron_time: str) -> time | None:
+    """Memoised body of :func:`parse_cron_time`; schedule sensors re-read the same strings every poll."""
     try:
-        parts = cron_time.split()
+        parts = cron_time.split(None, 2)
         if len(parts) >= 2:
             minute = int(parts[0])
             hour = int(parts[1])
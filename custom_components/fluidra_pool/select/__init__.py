@@ -10,6 +10,7 @@ from ..const import (
     DEVICE_TYPE_CHLORINATOR,
     DEVICE_TYPE_LIGHT,
     DEVICE_TYPE_PUMP,
+    PUMP_SCHEDULE_IDS,
     FluidraPoolConfigEntry,
 )
 from ..device_registry import DeviceIdentifier
@@ -60,12 +61,12 @@ async def async_setup_entry(
                 entities.append(FluidraChlorinatorModeSelect(coordinator, coordinator.api, pool_id, device_id))
 
             # Auxiliary outputs (OFF/ON/AUTO), for units that expose them.
-            for aux_number, component in sorted(DeviceIdentifier.get_feature(device, "aux_outputs", {}).items()):
-                entities.append(
-                    FluidraAuxOutputSelect(
-                        coordinator, coordinator.api, pool_id, device_id, str(aux_number), int(component)
-                    )
+            entities.extend(
+                FluidraAuxOutputSelect(
+                    coordinator, coordinator.api, pool_id, device_id, str(aux_number), int(component)
                 )
+                for aux_number, component in sorted(DeviceIdentifier.get_feature(device, "aux_outputs", {}).items())
+            )
 
         # Heat pumps don't expose speed or schedule controls.
         if DeviceIdentifier.has_feature(device, "skip_schedules"):
@@ -89,16 +90,10 @@ async def async_setup_entry(
             and device.get("schedule_data")
         ):
             # Pumps expose 8 schedule slots.
-            for schedule_id in ["1", "2", "3", "4", "5", "6", "7", "8"]:
-                entities.append(
-                    FluidraScheduleModeSelect(
-                        coordinator,
-                        coordinator.api,
-                        pool_id,
-                        device_id,
-                        schedule_id,
-                    )
-                )
+            entities.extend(
+                FluidraScheduleModeSelect(coordinator, coordinator.api, pool_id, device_id, schedule_id)
+                for schedule_id in PUMP_SCHEDULE_IDS
+            )
 
         if device_type == DEVICE_TYPE_LIGHT:
             effect_component = DeviceIdentifier.get_feature(device, "effect_select")
@@ -107,17 +102,10 @@ async def async_setup_entry(
 
         if device_type == DEVICE_TYPE_CHLORINATOR and DeviceIdentifier.has_feature(device, "schedule_component"):
             schedule_count = DeviceIdentifier.get_feature(device, "schedule_count", 3)
-            for i in range(1, schedule_count + 1):
-                schedule_id = str(i)
-                entities.append(
-                    FluidraChlorinatorScheduleSpeedSelect(
-                        coordinator,
-                        coordinator.api,
-                        pool_id,
-                        device_id,
-                        schedule_id,
-                    )
-                )
+            entities.extend(
+                FluidraChlorinatorScheduleSpeedSelect(coordinator, coordinator.api, pool_id, device_id, schedule_id)
+                for schedule_id in map(str, range(1, schedule_count + 1))
+            )
 
         return entities
 
@@ -76,7 +76,7 @@ class FluidraAuxOutputSelect(FluidraPoolControlEntity, SelectEntity):
 
     def _optimistic_expired(self) -> bool:
         """Return True once the optimistic value has outlived its timeout."""
-        return time.time() - self._optimistic_time > CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT
+        return time.monotonic() - self._optimistic_time > CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT
 
     @property
     def current_option(self) -> str | None:
@@ -102,7 +102,7 @@ class FluidraAuxOutputSelect(FluidraPoolControlEntity, SelectEntity):
             return
 
         self._optimistic_option = option
-        self._optimistic_time = time.time()
+        self._optimistic_time = time.monotonic()
         self.async_write_ha_state()
 
         await asyncio.sleep(UI_UPDATE_DELAY)
@@ -74,7 +74,7 @@ class FluidraChlorinatorModeSelect(FluidraPoolControlEntity, SelectEntity):
 
     def _optimistic_expired(self) -> bool:
         """Return True once the optimistic value has outlived its timeout."""
-        return time.time() - self._optimistic_time > CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT
+        return time.monotonic() - self._optimistic_time > CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT
 
     @property
     def current_option(self) -> str | None:
@@ -106,7 +106,7 @@ class FluidraChlorinatorModeSelect(FluidraPoolControlEntity, SelectEntity):
         mode_comp = DeviceIdentifier.get_feature(self.device_data, "mode_component", 20)
 
         self._optimistic_option = option
-        self._optimistic_time = time.time()
+        self._optimistic_time = time.monotonic()
         self.async_write_ha_state()
 
         await asyncio.sleep(UI_UPDATE_DELAY)
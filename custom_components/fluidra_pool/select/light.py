@@ -97,7 +97,7 @@ class FluidraLightEffectSelect(FluidraPoolControlEntity, SelectEntity):
 
     def _optimistic_expired(self) -> bool:
         """Return True once the optimistic value has outlived its timeout."""
-        return time.time() - self._optimistic_time > OPTIMISTIC_ACTION_TIMEOUT
+        return time.monotonic() - self._optimistic_time > OPTIMISTIC_ACTION_TIMEOUT
 
     @property
     def current_option(self) -> str | None:
@@ -128,7 +128,7 @@ class FluidraLightEffectSelect(FluidraPoolControlEntity, SelectEntity):
         effect_value = self._effect_mapping[option]
 
         self._optimistic_option = option
-        self._optimistic_time = time.time()
+        self._optimistic_time = time.monotonic()
         self.async_write_ha_state()
 
         await asyncio.sleep(UI_UPDATE_DELAY)
@@ -15,8 +15,8 @@ from ..api_resilience import FluidraError
 from ..const import COMMAND_CONFIRMATION_DELAY, DOMAIN, UI_UPDATE_DELAY
 from ..device_registry import DeviceIdentifier
 from ..entity import FluidraPoolControlEntity
-from ..helpers import get_schedule_data, resolve_schedule_component
-from ..utils import convert_cron_days
+from ..helpers import get_schedule_data, resolve_schedule_component, schedule_operation_name
+from ..utils import DEFAULT_CRON_ALL_DAYS, DEFAULT_CRON_END_ALL_DAYS, convert_cron_days
 
 if TYPE_CHECKING:
     from ..coordinator import FluidraDataUpdateCoordinator
@@ -40,7 +40,7 @@ class FluidraScheduleModeSelect(FluidraPoolControlEntity, SelectEntity):
     ) -> None:
         """Initialize the schedule mode select."""
         super().__init__(coordinator, api, pool_id, device_id)
-        self._schedule_id = schedule_id
+        self._schedule_id = str(schedule_id)
 
         self._attr_translation_key = "schedule_mode"
         self._attr_translation_placeholders = {"schedule_id": schedule_id}
@@ -52,11 +52,7 @@ class FluidraScheduleModeSelect(FluidraPoolControlEntity, SelectEntity):
 
     def _get_schedule_data(self) -> dict[str, Any] | None:
         """Get schedule data from coordinator."""
-        try:
-            return get_schedule_data(self.device_data, self._schedule_id)
-        except (aiohttp.ClientError, TimeoutError, FluidraError, ValueError, TypeError, KeyError, AttributeError):
-            _LOGGER.debug("Failed to get schedule data for %s", self._device_id)
-            return None
+        return get_schedule_data(self.device_data, self._schedule_id)
 
     @property
     def available(self) -> bool:
@@ -68,8 +64,7 @@ class FluidraScheduleModeSelect(FluidraPoolControlEntity, SelectEntity):
         """Return the current mode option."""
         schedule = self._get_schedule_data()
         if schedule:
-            operation = schedule.get("startActions", {}).get("operationName", "0")
-            return str(operation)
+            return schedule_operation_name(schedule)
         return "0"
 
     async def async_select_option(self, option: str) -> None:
@@ -92,11 +87,7 @@ class FluidraScheduleModeSelect(FluidraPoolControlEntity, SelectEntity):
                 start_time = convert_cron_days(sched.get("startTime", ""))
                 end_time = convert_cron_days(sched.get("endTime", ""))
 
-                operation_name = (
-                    option
-                    if str(sched.get("id")) == str(self._schedule_id)
-                    else str(sched.get("startActions", {}).get("operationName", "0"))
-                )
+                operation_name = option if str(sched.get("id")) == self._schedule_id else schedule_operation_name(sched)
 
                 scheduler = {
                     "id": sched.get("id"),
@@ -185,7 +176,7 @@ class FluidraChlorinatorScheduleSpeedSelect(FluidraPoolControlEntity, SelectEnti
     ) -> None:
         """Initialize the chlorinator schedule speed select."""
         super().__init__(coordinator, api, pool_id, device_id)
-        self._schedule_id = schedule_id
+        self._schedule_id = str(schedule_id)
         self._optimistic_option: str | None = None
 
         device_data = self.device_data
@@ -210,11 +201,7 @@ class FluidraChlorinatorScheduleSpeedSelect(FluidraPoolControlEntity, SelectEnti
 
     def _get_schedule_data(self) -> dict[str, Any] | None:
         """Get schedule data from coordinator."""
-        try:
-            return get_schedule_data(self.device_data, self._schedule_id)
-        except (aiohttp.ClientError, TimeoutError, FluidraError, ValueError, TypeError, KeyError, AttributeError):
-            _LOGGER.debug("Failed to get schedule data for %s", self._device_id)
-            return None
+        return get_schedule_data(self.device_data, self._schedule_id)
 
     @property
     def available(self) -> bool:
@@ -271,10 +258,10 @@ class FluidraChlorinatorScheduleSpeedSelect(FluidraPoolControlEntity, SelectEnti
 
             updated_schedules = []
             for sched in current_schedules:
-                start_time = sched.get("startTime", "00 00 * * 1,2,3,4,5,6,7")
-                end_time = sched.get("endTime", "00 01 * * 1,2,3,4,5,6,7")
+                start_time = sched.get("startTime", DEFAULT_CRON_ALL_DAYS)
+                end_time = sched.get("endTime", DEFAULT_CRON_END_ALL_DAYS)
 
-                if str(sched.get("id")) == str(self._schedule_id):
+                if str(sched.get("id")) == self._schedule_id:
                     operation_name = self._speed_mapping[option]
                 else:
                     start_actions = sched.get("startActions", {})
@@ -354,7 +341,7 @@ class FluidraChlorinatorScheduleSpeedSelect(FluidraPoolControlEntity, SelectEnti
     def _format_cron_time(self, cron_time: str) -> str:
         """Format CRON time to match official app format (00 05 * * 1,2,3,4,5,6,7)."""
         if not cron_time:
-            return "00 00 * * 1,2,3,4,5,6,7"
+            return DEFAULT_CRON_ALL_DAYS
 
         parts = cron_time.split()
         if len(parts) >= 5:
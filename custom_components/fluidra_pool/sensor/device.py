@@ -21,7 +21,7 @@ from homeassistant.util import dt as dt_util
 from ..api_resilience import FluidraError
 from ..const import LUMIPLUS_COMPONENT_BRIGHTNESS
 from ..device_registry import DeviceIdentifier
-from ..helpers import parse_cron_time
+from ..helpers import parse_cron_time, schedule_operation_name
 from .base import FluidraPoolSensorEntity
 
 if TYPE_CHECKING:
@@ -657,8 +657,7 @@ class FluidraPumpScheduleSensor(FluidraPoolSensorEntity):
                 for schedule in schedules:
                     if schedule.get("enabled", False):
                         time_range = self._format_schedule_time(schedule)
-                        operation = schedule.get("startActions", {}).get("operationName", "0")
-                        mode = self._get_operation_name(operation)
+                        mode = self._get_operation_name(schedule_operation_name(schedule))
 
                         formatted_schedules.append(
                             {
@@ -677,9 +676,7 @@ class FluidraPumpScheduleSensor(FluidraPoolSensorEntity):
                 if current_schedule:
                     attrs["current_schedule_id"] = current_schedule.get("id")
                     attrs["current_time_range"] = self._format_schedule_time(current_schedule)
-                    attrs["current_mode"] = self._get_operation_name(
-                        current_schedule.get("startActions", {}).get("operationName", "0")
-                    )
+                    attrs["current_mode"] = self._get_operation_name(schedule_operation_name(current_schedule))
 
         except (aiohttp.ClientError, TimeoutError, FluidraError, ValueError, TypeError, KeyError, AttributeError) as e:
             attrs["error"] = str(e)
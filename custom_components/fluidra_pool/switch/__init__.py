@@ -87,28 +87,28 @@ async def async_setup_entry(
 
         if DeviceIdentifier.has_feature(device, "schedules"):
             schedule_count = DeviceIdentifier.get_feature(device, "schedule_count", 8)
-            for schedule_id in [str(i) for i in range(1, schedule_count + 1)]:
-                entities.append(
-                    FluidraScheduleEnableSwitch(coordinator, coordinator.api, pool_id, device_id, schedule_id)
-                )
+            entities.extend(
+                FluidraScheduleEnableSwitch(coordinator, coordinator.api, pool_id, device_id, schedule_id)
+                for schedule_id in map(str, range(1, schedule_count + 1))
+            )
 
         if DeviceIdentifier.has_feature(device, "boost_mode"):
             entities.append(FluidraChlorinatorBoostSwitch(coordinator, coordinator.api, pool_id, device_id))
 
         # Plain boolean registers a profile can opt into by declaring the feature.
-        for feature, translation_key, icon in TOGGLE_SWITCHES:
-            if DeviceIdentifier.has_feature(device, feature):
-                entities.append(
-                    FluidraChlorinatorToggleSwitch(
-                        coordinator,
-                        coordinator.api,
-                        pool_id,
-                        device_id,
-                        feature,
-                        translation_key,
-                        icon,
-                    )
-                )
+        entities.extend(
+            FluidraChlorinatorToggleSwitch(
+                coordinator,
+                coordinator.api,
+                pool_id,
+                device_id,
+                feature,
+                translation_key,
+                icon,
+            )
+            for feature, translation_key, icon in TOGGLE_SWITCHES
+            if DeviceIdentifier.has_feature(device, feature)
+        )
 
         return entities
 
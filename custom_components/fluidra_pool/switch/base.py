@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import time
 from typing import TYPE_CHECKING
 
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
 class FluidraPoolSwitchEntity(FluidraPoolControlEntity, SwitchEntity):
     """Base class for Fluidra Pool switch entities."""
 
-    __slots__ = ("_last_action_time", "_pending_state")
+    __slots__ = ("_last_action_time", "_last_action_timestamp", "_pending_state")
 
     def __init__(
         self,
@@ -30,12 +31,13 @@ class FluidraPoolSwitchEntity(FluidraPoolControlEntity, SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator, api, pool_id, device_id)
         self._pending_state: bool | None = None
+        # Monotonic clock for the pending-state timeout; wall-clock epoch for
+        # the user-visible action_timestamp attribute.
         self._last_action_time: float | None = None
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{DOMAIN}_{self._pool_id}_{self._device_id}"
+        self._last_action_timestamp: float | None = None
+        # Built once (and interned, since it is a registry key) instead of on
+        # every unique_id access; subclasses overwrite it or the property.
+        self._attr_unique_id = sys.intern(f"{DOMAIN}_{self._pool_id}_{self._device_id}")
 
     @property
     def assumed_state(self) -> bool:
@@ -44,16 +46,23 @@ class FluidraPoolSwitchEntity(FluidraPoolControlEntity, SwitchEntity):
 
     def _set_pending_state(self, state: bool) -> None:
         """Set pending state for optimistic UI updates."""
+        self._last_action_time = time.monotonic()
+        self._last_action_timestamp = time.time()
+        if self._pending_state is state:
+            # Repeated command: restart the timeout, the displayed state is unchanged.
+            return
         self._pending_state = state
-        self._last_action_time = time.time()
         self.async_write_ha_state()
 
     def _clear_pending_state(self) -> None:
         """Clear pending state after API confirmation."""
+        if self._pending_state is None:
+            return
         self._pending_state = None
         self._last_action_time = None
+        self._last_action_timestamp = None
         self.async_write_ha_state()
 
     def _pending_state_expired(self, timeout: float) -> bool:
         """Return True if a pending optimistic state has timed out."""
-        return self._last_action_time is None or time.time() - self._last_action_time > timeout
+        return self._last_action_time is None or time.monotonic() - self._last_action_time > timeout
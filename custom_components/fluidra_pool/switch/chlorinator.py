@@ -24,6 +24,8 @@ _LOGGER = logging.getLogger(__name__)
 class FluidraChlorinatorBoostSwitch(FluidraPoolSwitchEntity):
     """Switch for chlorinator boost mode."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: FluidraDataUpdateCoordinator,
@@ -38,6 +40,16 @@ class FluidraChlorinatorBoostSwitch(FluidraPoolSwitchEntity):
         self._attr_translation_key = "boost_mode"
         self._attr_icon = "mdi:rocket-launch"
 
+    @property
+    def _boost_component(self) -> int:
+        """Return the boost register for the device's current profile.
+
+        Resolved on each access: the profile can still change after setup (the
+        tecnoLC2 signature only applies once c8/c172 have been scanned).
+        """
+        component: int = DeviceIdentifier.get_feature(self.device_data, "boost_mode", 245)
+        return component
+
     @property
     def unique_id(self) -> str:
         """Return unique ID (override base class to use _attr_unique_id)."""
@@ -70,15 +82,16 @@ class FluidraChlorinatorBoostSwitch(FluidraPoolSwitchEntity):
             return True
         return self._get_current_mode() == "on"
 
+    def _reported_boost(self) -> bool:
+        """Return the boost state last reported by the device."""
+        components = self.device_data.get("components", {})
+        component_data = components.get(str(self._boost_component), {})
+        return bool(component_data.get("reportedValue", False))
+
     @property
     def is_on(self) -> bool:
         """Return true if boost mode is on using optimistic UI."""
-        boost_component = DeviceIdentifier.get_feature(self.device_data, "boost_mode", 245)
-
-        components = self.device_data.get("components", {})
-        component_data = components.get(str(boost_component), {})
-        boost_value = component_data.get("reportedValue", False)
-        actual_state = bool(boost_value)
+        actual_state = self._reported_boost()
 
         if self._pending_state is not None:
             if actual_state == self._pending_state or self._pending_state_expired(10):
@@ -91,8 +104,10 @@ class FluidraChlorinatorBoostSwitch(FluidraPoolSwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn boost mode on with optimistic UI."""
         self._ensure_pool_writable()
-        boost_component = DeviceIdentifier.get_feature(self.device_data, "boost_mode", 245)
-
+        if self._pending_state is None and self._reported_boost():
+            # Already boosting; re-sending would only restart the wait below
+            # (and may restart the device's boost countdown).
+            return
         mode_comp = DeviceIdentifier.get_feature(self.device_data, "mode_component", 20)
         mode_mapping = DeviceIdentifier.get_feature(self.device_data, "mode_mapping", None)
         if mode_mapping:
@@ -111,7 +126,7 @@ class FluidraChlorinatorBoostSwitch(FluidraPoolSwitchEntity):
                 await self._api.control_device_component(self._device_id, mode_comp, on_value)
                 await asyncio.sleep(0.5)
 
-            success = await self._api.control_device_component(self._device_id, boost_component, True)
+            success = await self._api.control_device_component(self._device_id, self._boost_component, True)
 
             if success:
                 await asyncio.sleep(SWITCH_CONFIRMATION_DELAY)
@@ -133,18 +148,17 @@ class FluidraChlorinatorBoostSwitch(FluidraPoolSwitchEntity):
         ) as err:
             _LOGGER.debug("Failed to enable boost mode: %s", err)
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="boost_set_failed") from err
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn boost mode off with optimistic UI."""
         self._ensure_pool_writable()
-        boost_component = DeviceIdentifier.get_feature(self.device_data, "boost_mode", 245)
-
+        if self._pending_state is None and not self._reported_boost():
+            return
         try:
             self._set_pending_state(False)
 
-            success = await self._api.control_device_component(self._device_id, boost_component, False)
+            success = await self._api.control_device_component(self._device_id, self._boost_component, False)
 
             if success:
                 await asyncio.sleep(SWITCH_CONFIRMATION_DELAY)
@@ -166,16 +180,13 @@ class FluidraChlorinatorBoostSwitch(FluidraPoolSwitchEntity):
         ) as err:
             _LOGGER.debug("Failed to disable boost mode: %s", err)
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="boost_set_failed") from err
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        boost_component = DeviceIdentifier.get_feature(self.device_data, "boost_mode", 245)
-
         return {
-            "component": boost_component,
+            "component": self._boost_component,
             "device_id": self._device_id,
             "current_mode": self._get_current_mode(),
             "pending_action": self._pending_state is not None,
@@ -191,6 +202,8 @@ class FluidraChlorinatorToggleSwitch(FluidraPoolSwitchEntity):
     mode handling — unlike boost, which may have to flip the unit to ON first.
     """
 
+    __slots__ = ("_feature",)
+
     def __init__(
         self,
         coordinator: FluidraDataUpdateCoordinator,
@@ -266,7 +279,6 @@ class FluidraChlorinatorToggleSwitch(FluidraPoolSwitchEntity):
         ) as err:
             _LOGGER.debug("Failed to set %s to %s: %s", self._feature, state, err)
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="switch_set_failed") from err
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -290,8 +302,13 @@ class FluidraChlorinatorToggleSwitch(FluidraPoolSwitchEntity):
 class FluidraChlorinatorSwitch(FluidraPoolSwitchEntity):
     """Switch for controlling chlorinator ON/OFF (e.g., Zodiac EXO iQ)."""
 
+    __slots__ = ()
+
     _attr_translation_key = "chlorinator"
 
+    # Attributes that never change, merged into the live ones on each state write.
+    _static_attributes: dict[str, Any] = {"operation": "chlorinator_control"}
+
     @property
     def unique_id(self) -> str:
         """Return unique ID."""
@@ -357,7 +374,6 @@ class FluidraChlorinatorSwitch(FluidraPoolSwitchEntity):
         ) as err:
             _LOGGER.debug("Failed to turn on chlorinator: %s", err)
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="chlorinator_set_failed") from err
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -388,17 +404,15 @@ class FluidraChlorinatorSwitch(FluidraPoolSwitchEntity):
         ) as err:
             _LOGGER.debug("Failed to turn off chlorinator: %s", err)
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="chlorinator_set_failed") from err
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
         on_off_component = DeviceIdentifier.get_feature(self.device_data, "on_off_component", 9)
-        return {
+        return self._static_attributes | {
             "component_id": on_off_component,
-            "operation": "chlorinator_control",
             "device_id": self._device_id,
             "pending_action": self._pending_state is not None,
-            "action_timestamp": self._last_action_time,
+            "action_timestamp": self._last_action_timestamp,
         }
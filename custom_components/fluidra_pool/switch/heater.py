@@ -20,8 +20,13 @@ _LOGGER = logging.getLogger(__name__)
 class FluidraHeatPumpSwitch(FluidraPoolSwitchEntity):
     """Switch for controlling pool heat pumps (Astralpool Eco Elyo, etc.)."""
 
+    __slots__ = ()
+
     _attr_translation_key = "heat_pump"
 
+    # Attributes that never change, merged into the live ones on each state write.
+    _static_attributes: dict[str, Any] = {"operation": "heat_pump_control", "device_type": "heat_pump"}
+
     @property
     def icon(self) -> str:
         """Return the icon of the switch."""
@@ -63,7 +68,6 @@ class FluidraHeatPumpSwitch(FluidraPoolSwitchEntity):
         self._ensure_pool_writable()
         try:
             self._set_pending_state(True)
-            self.async_write_ha_state()
 
             # Z550iQ+ uses component 21 for ON/OFF
             if DeviceIdentifier.has_feature(self.device_data, "z550_mode"):
@@ -81,14 +85,12 @@ class FluidraHeatPumpSwitch(FluidraPoolSwitchEntity):
                 await self.coordinator.async_request_refresh()
             else:
                 self._clear_pending_state()
-                self.async_write_ha_state()
                 raise HomeAssistantError(translation_domain=DOMAIN, translation_key="heat_pump_set_failed")
         except HomeAssistantError:
             raise
         except (aiohttp.ClientError, TimeoutError, FluidraError, ValueError, TypeError, KeyError, AttributeError) as e:
             _LOGGER.error("Error turning on heat pump %s: %s", self._device_id, e)
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="heat_pump_set_failed") from e
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -96,7 +98,6 @@ class FluidraHeatPumpSwitch(FluidraPoolSwitchEntity):
         self._ensure_pool_writable()
         try:
             self._set_pending_state(False)
-            self.async_write_ha_state()
 
             if DeviceIdentifier.has_feature(self.device_data, "z550_mode"):
                 _LOGGER.debug("Z550iQ+ turn OFF: using component 21 for device %s", self._device_id)
@@ -112,35 +113,32 @@ class FluidraHeatPumpSwitch(FluidraPoolSwitchEntity):
                 await self.coordinator.async_request_refresh()
             else:
                 self._clear_pending_state()
-                self.async_write_ha_state()
                 raise HomeAssistantError(translation_domain=DOMAIN, translation_key="heat_pump_set_failed")
         except HomeAssistantError:
             raise
         except (aiohttp.ClientError, TimeoutError, FluidraError, ValueError, TypeError, KeyError, AttributeError) as e:
             _LOGGER.error("Error turning off heat pump %s: %s", self._device_id, e)
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="heat_pump_set_failed") from e
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs: dict[str, Any] = {
-            "component_id": DeviceIdentifier.get_feature(self.device_data, "on_off_component", 13),
-            "operation": "heat_pump_control",
-            "device_type": "heat_pump",
-            "heat_pump_reported": self.device_data.get("heat_pump_reported"),
-            "heat_pump_desired": self.device_data.get("heat_pump_desired"),
-            "connectivity": self.device_data.get("connectivity", {}),
-            "last_update": self.device_data.get("last_update"),
+        device_data = self.device_data
+        attrs: dict[str, Any] = self._static_attributes | {
+            "component_id": DeviceIdentifier.get_feature(device_data, "on_off_component", 13),
+            "heat_pump_reported": device_data.get("heat_pump_reported"),
+            "heat_pump_desired": device_data.get("heat_pump_desired"),
+            "connectivity": device_data.get("connectivity", {}),
+            "last_update": device_data.get("last_update"),
             "pending_action": self._pending_state is not None,
-            "action_timestamp": self._last_action_time,
+            "action_timestamp": self._last_action_timestamp,
         }
 
-        if "current_temperature" in self.device_data:
-            attrs["current_temperature"] = self.device_data["current_temperature"]
-        if "target_temperature" in self.device_data:
-            attrs["target_temperature"] = self.device_data["target_temperature"]
+        if "current_temperature" in device_data:
+            attrs["current_temperature"] = device_data["current_temperature"]
+        if "target_temperature" in device_data:
+            attrs["target_temperature"] = device_data["target_temperature"]
 
         return attrs
 
@@ -148,6 +146,8 @@ class FluidraHeatPumpSwitch(FluidraPoolSwitchEntity):
 class FluidraHeaterSwitch(FluidraPoolSwitchEntity):
     """Switch for controlling pool heaters."""
 
+    __slots__ = ()
+
     _attr_has_entity_name = True
     _attr_translation_key = "heater"
 
@@ -181,7 +181,6 @@ class FluidraHeaterSwitch(FluidraPoolSwitchEntity):
             success = await self._api.control_device_component(self._device_id, COMPONENT_PUMP_ONOFF, 1)
         except (aiohttp.ClientError, TimeoutError, FluidraError) as err:
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="heater_set_failed") from err
         if success:
             await asyncio.sleep(SWITCH_CONFIRMATION_DELAY)
@@ -198,7 +197,6 @@ class FluidraHeaterSwitch(FluidraPoolSwitchEntity):
             success = await self._api.control_device_component(self._device_id, COMPONENT_PUMP_ONOFF, 0)
         except (aiohttp.ClientError, TimeoutError, FluidraError) as err:
             self._clear_pending_state()
-            self.async_write_ha_state()
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="heater_set_failed") from err
         if success:
             await asyncio.sleep(SWITCH_CONFIRMATION_DELAY)
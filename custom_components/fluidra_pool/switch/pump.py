@@ -25,8 +25,13 @@ _LOGGER = logging.getLogger(__name__)
 class FluidraPumpSwitch(FluidraPoolSwitchEntity):
     """Switch for controlling pool pumps (ON/OFF)."""
 
+    __slots__ = ()
+
     _attr_translation_key = "pump"
 
+    # Attributes that never change, merged into the live ones on each state write.
+    _static_attributes: dict[str, Any] = {"component_id": 9, "operation": "pump_control"}
+
     @property
     def icon(self) -> str:
         """Return the icon of the switch."""
@@ -108,25 +113,32 @@ class FluidraPumpSwitch(FluidraPoolSwitchEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        return {
-            "component_id": 9,
-            "operation": "pump_control",
-            "speed_percent": self.device_data.get("speed_percent", 0),
-            "operation_mode": self.device_data.get("operation_mode", 0),
-            "pump_reported": self.device_data.get("pump_reported"),
-            "pump_desired": self.device_data.get("pump_desired"),
-            "connectivity": self.device_data.get("connectivity", {}),
-            "last_update": self.device_data.get("last_update"),
+        device_data = self.device_data
+        return self._static_attributes | {
+            "speed_percent": device_data.get("speed_percent", 0),
+            "operation_mode": device_data.get("operation_mode", 0),
+            "pump_reported": device_data.get("pump_reported"),
+            "pump_desired": device_data.get("pump_desired"),
+            "connectivity": device_data.get("connectivity", {}),
+            "last_update": device_data.get("last_update"),
             "pending_action": self._pending_state is not None,
-            "action_timestamp": self._last_action_time,
+            "action_timestamp": self._last_action_timestamp,
         }
 
 
 class FluidraAutoModeSwitch(FluidraPoolSwitchEntity):
     """Switch for controlling pump auto mode (ON/OFF)."""
 
+    __slots__ = ()
+
     _attr_translation_key = "auto_mode"
 
+    _static_attributes: dict[str, Any] = {
+        "component_id": 10,
+        "operation": "auto_mode_control",
+        "function": "Mode automatique/programmé",
+    }
+
     @property
     def unique_id(self) -> str:
         """Return unique ID."""
@@ -223,14 +235,12 @@ class FluidraAutoModeSwitch(FluidraPoolSwitchEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        return {
-            "component_id": 10,
-            "operation": "auto_mode_control",
-            "function": "Mode automatique/programmé",
-            "auto_reported": self.device_data.get("auto_reported"),
-            "auto_desired": self.device_data.get("auto_desired"),
-            "connectivity": self.device_data.get("connectivity", {}),
-            "last_update": self.device_data.get("last_update"),
+        device_data = self.device_data
+        return self._static_attributes | {
+            "auto_reported": device_data.get("auto_reported"),
+            "auto_desired": device_data.get("auto_desired"),
+            "connectivity": device_data.get("connectivity", {}),
+            "last_update": device_data.get("last_update"),
             "pending_action": self._pending_state is not None,
-            "action_timestamp": self._last_action_time,
+            "action_timestamp": self._last_action_timestamp,
         }
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -11,7 +13,7 @@ from homeassistant.exceptions import HomeAssistantError
 
 from ..api_resilience import FluidraError
 from ..const import DOMAIN
-from ..helpers import get_schedule_data, resolve_schedule_component
+from ..helpers import get_schedule_data, index_schedules, resolve_schedule_component
 from .base import FluidraPoolSwitchEntity
 
 if TYPE_CHECKING:
@@ -21,8 +23,8 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-def _with_enabled(schedules: list[dict[str, Any]], schedule_id: Any, enabled: bool) -> list[dict[str, Any]]:
-    """Return the schedules unchanged except for the target slot's ``enabled`` flag.
+def _with_overrides(schedules: list[dict[str, Any]], overrides: dict[str, bool]) -> list[dict[str, Any]]:
+    """Return the schedules unchanged except for the ``enabled`` flag of each slot in *overrides*.
 
     Toggling a slot must not rewrite anything else. The previous implementation
     rebuilt each entry from scratch, which corrupted schedules on devices whose
@@ -35,13 +37,14 @@ def _with_enabled(schedules: list[dict[str, Any]], schedule_id: Any, enabled: bo
       though the values had just been read back from the API in that same format,
       shifting the configured days.
 
-    Copying the entry verbatim and touching only the one field being changed avoids
+    Copying the entry verbatim and touching only the field being changed avoids
     the whole class of problem, and keeps working for payload shapes we've never seen.
     """
     updated: list[dict[str, Any]] = []
     for sched in schedules:
         entry = dict(sched)
-        if str(entry.get("id")) == str(schedule_id):
+        enabled = overrides.get(str(entry.get("id")))
+        if enabled is not None:
             entry["enabled"] = enabled
         # The API rejects a payload without groupId; mirror id when it's absent.
         entry.setdefault("groupId", entry.get("id"))
@@ -49,9 +52,41 @@ def _with_enabled(schedules: list[dict[str, Any]], schedule_id: Any, enabled: bo
     return updated
 
 
+class _ScheduleBatch:
+    """Schedule toggles for one device that will go out as a single write.
+
+    ``set_schedule`` always sends the device's whole schedule list, so two
+    toggles that each POST their own copy race each other and the later one
+    silently reverts the earlier (a scene flipping several slots hits this).
+    The first toggle becomes the leader: it yields once (or, if a write for the
+    device is still in flight, waits for it) so other toggles can add their
+    override, then sends one payload carrying all of them and hands the result
+    to the others.
+    """
+
+    __slots__ = ("done", "overrides")
+
+    def __init__(self) -> None:
+        """Initialize an empty batch bound to the running loop."""
+        self.overrides: dict[str, bool] = {}
+        self.done: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+
+
+# device_id -> batch still accepting toggles. The leader removes it right
+# before building the payload.
+_pending_batches: dict[str, _ScheduleBatch] = {}
+
+# device_id -> completion future of the latest write. A new batch waits on it
+# before reading schedule_data, so consecutive writes never start from the
+# same stale snapshot (each one would otherwise undo the other's change).
+_last_writes: dict[str, asyncio.Future[bool]] = {}
+
+
 class FluidraScheduleEnableSwitch(FluidraPoolSwitchEntity):
     """Switch for enabling/disabling existing schedules."""
 
+    __slots__ = ("_schedule_id",)
+
     def __init__(
         self,
         coordinator: FluidraDataUpdateCoordinator,
@@ -62,11 +97,13 @@ class FluidraScheduleEnableSwitch(FluidraPoolSwitchEntity):
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, api, pool_id, device_id)
-        self._schedule_id = schedule_id
+        # Stored as a string once; the API mixes int/str ids, so every
+        # comparison is done against str(sched["id"]).
+        self._schedule_id = str(schedule_id)
 
         self._attr_translation_key = "schedule_enable"
         self._attr_translation_placeholders = {"schedule_id": schedule_id}
-        self._attr_unique_id = f"fluidra_{self._device_id}_schedule_{schedule_id}_enabled"
+        self._attr_unique_id = sys.intern(f"fluidra_{self._device_id}_schedule_{schedule_id}_enabled")
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -83,11 +120,7 @@ class FluidraScheduleEnableSwitch(FluidraPoolSwitchEntity):
 
     def _get_schedule_data(self) -> dict[str, Any] | None:
         """Get schedule data from coordinator."""
-        try:
-            return get_schedule_data(self.device_data, self._schedule_id)
-        except (aiohttp.ClientError, TimeoutError, FluidraError, ValueError, TypeError, KeyError, AttributeError):
-            _LOGGER.debug("Failed to get schedule data for %s", self._device_id)
-            return None
+        return get_schedule_data(self.device_data, self._schedule_id)
 
     def _get_schedule_component(self) -> int:
         """Get the schedule component used by this device."""
@@ -121,61 +154,53 @@ class FluidraScheduleEnableSwitch(FluidraPoolSwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the schedule using exact mobile app format with optimistic UI."""
-        self._ensure_pool_writable()
-        try:
-            self._set_pending_state(True)
-            device_data = self.device_data
-            if "schedule_data" not in device_data:
-                self._clear_pending_state()
-                return
+        await self._apply_schedule_state(True)
 
-            current_schedules = device_data["schedule_data"]
-            if not current_schedules:
-                self._clear_pending_state()
-                return
-            schedule_component = self._get_schedule_component()
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Disable the schedule using exact mobile app format with optimistic UI."""
+        await self._apply_schedule_state(False)
 
-            updated_schedules = _with_enabled(current_schedules, self._schedule_id, True)
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        schedule = self._get_schedule_data()
+        attrs: dict[str, Any] = {
+            "schedule_id": self._schedule_id,
+            "device_id": self._device_id,
+        }
 
-            # No padding — Fluidra fills the remaining slots; padding to 8 with
-            # identical placeholder windows is rejected as "OVERLAP in sched" (Issue #105).
-            success = await self._api.set_schedule(self._device_id, updated_schedules, component_id=schedule_component)
-            if success:
-                # Keep optimistic state until is_on observes server confirmation
-                # or the 15 s safety timeout — clearing here flipped the UI back.
-                await self.coordinator.async_request_refresh()
-            else:
-                self._clear_pending_state()
-                raise HomeAssistantError(
-                    translation_domain=DOMAIN,
-                    translation_key="schedule_set_failed",
-                    translation_placeholders={"device_id": self._device_id},
-                )
+        if schedule:
+            attrs.update(
+                {
+                    "start_time": schedule.get("startTime", ""),
+                    "end_time": schedule.get("endTime", ""),
+                    "state": schedule.get("state", "IDLE"),
+                    "start_action": schedule.get("startActions", {}),
+                    "end_action": schedule.get("endActions", {}),
+                }
+            )
 
-        except HomeAssistantError:
-            raise
-        except (
-            aiohttp.ClientError,
-            TimeoutError,
-            FluidraError,
-            ValueError,
-            TypeError,
-            KeyError,
-            AttributeError,
-        ) as err:
-            _LOGGER.debug("Failed to enable schedule: %s", err)
-            self._clear_pending_state()
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="schedule_set_failed",
-                translation_placeholders={"device_id": self._device_id},
-            ) from err
+        attrs.update(
+            {"pending_action": self._pending_state is not None, "action_timestamp": self._last_action_timestamp}
+        )
 
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable the schedule using exact mobile app format with optimistic UI."""
+        return attrs
+
+    async def _apply_schedule_state(self, enabled: bool) -> None:
+        """Write the device's schedules back with this slot's ``enabled`` flag set."""
         self._ensure_pool_writable()
+        if self._pending_state is not None:
+            current: bool | None = self._pending_state
+        else:
+            schedule = self._get_schedule_data()
+            current = bool(schedule.get("enabled", False)) if schedule is not None else None
+        if current is enabled:
+            # Nothing to change (or a repeat tap while the same write is still
+            # pending); a redundant write would resend the whole list and could
+            # clobber edits made in the app since the poll.
+            return
         try:
-            self._set_pending_state(False)
+            self._set_pending_state(enabled)
             device_data = self.device_data
             if "schedule_data" not in device_data:
                 self._clear_pending_state()
@@ -185,13 +210,19 @@ class FluidraScheduleEnableSwitch(FluidraPoolSwitchEntity):
             if not current_schedules:
                 self._clear_pending_state()
                 return
-            schedule_component = self._get_schedule_component()
 
-            updated_schedules = _with_enabled(current_schedules, self._schedule_id, False)
+            batch = _pending_batches.get(self._device_id)
+            if batch is not None:
+                # Another slot of this device is being written in this same
+                # iteration; ride along with its payload.
+                batch.overrides[self._schedule_id] = enabled
+                success = await asyncio.shield(batch.done)
+            else:
+                success = await self._send_schedule_batch(current_schedules, enabled)
 
-            # No padding — see the OVERLAP-in-sched note in async_turn_on (Issue #105).
-            success = await self._api.set_schedule(self._device_id, updated_schedules, component_id=schedule_component)
             if success:
+                # Keep optimistic state until is_on observes server confirmation
+                # or the 15 s safety timeout — clearing here flipped the UI back.
                 await self.coordinator.async_request_refresh()
             else:
                 self._clear_pending_state()
@@ -212,7 +243,7 @@ class FluidraScheduleEnableSwitch(FluidraPoolSwitchEntity):
             KeyError,
             AttributeError,
         ) as err:
-            _LOGGER.debug("Failed to disable schedule: %s", err)
+            _LOGGER.debug("Failed to %s schedule: %s", "enable" if enabled else "disable", err)
             self._clear_pending_state()
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -220,26 +251,45 @@ class FluidraScheduleEnableSwitch(FluidraPoolSwitchEntity):
                 translation_placeholders={"device_id": self._device_id},
             ) from err
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        schedule = self._get_schedule_data()
-        attrs: dict[str, Any] = {
-            "schedule_id": self._schedule_id,
-            "device_id": self._device_id,
-        }
+    async def _send_schedule_batch(self, current_schedules: list[dict[str, Any]], enabled: bool) -> bool:
+        """Lead a :class:`_ScheduleBatch`: collect toggles, wait for the previous write, then write once."""
+        batch = _pending_batches[self._device_id] = _ScheduleBatch()
+        batch.overrides[self._schedule_id] = enabled
+        previous = _last_writes.get(self._device_id)
+        _last_writes[self._device_id] = batch.done
+        success = False
+        try:
+            try:
+                if previous is not None:
+                    # Keeps collecting toggles while the earlier write is in flight.
+                    await asyncio.shield(previous)
+                else:
+                    await asyncio.sleep(0)
+            finally:
+                del _pending_batches[self._device_id]
+
+            # Re-read: a successful earlier write has patched the cached list.
+            schedules = self.device_data.get("schedule_data") or current_schedules
+            updated_schedules = _with_overrides(schedules, batch.overrides)
 
-        if schedule:
-            attrs.update(
-                {
-                    "start_time": schedule.get("startTime", ""),
-                    "end_time": schedule.get("endTime", ""),
-                    "state": schedule.get("state", "IDLE"),
-                    "start_action": schedule.get("startActions", {}),
-                    "end_action": schedule.get("endActions", {}),
-                }
+            # No padding — Fluidra fills the remaining slots; padding to 8 with
+            # identical placeholder windows is rejected as "OVERLAP in sched" (Issue #105).
+            success = await self._api.set_schedule(
+                self._device_id, updated_schedules, component_id=self._get_schedule_component()
             )
-
-        attrs.update({"pending_action": self._pending_state is not None, "action_timestamp": self._last_action_time})
-
-        return attrs
+            if success:
+                # Patch the cached copy with what was just written, so the next
+                # toggle builds on it instead of on the pre-write list, and
+                # is_on can confirm without waiting for the poll. The refresh
+                # the caller requests still replaces it with the server's view.
+                device_data = self.device_data
+                if device_data:
+                    device_data["schedule_data"] = updated_schedules
+                    device_data["_schedules_by_id"] = index_schedules(updated_schedules)
+            return success
+        finally:
+            # Followers only need to know whether the write landed; each raises
+            # its own schedule_set_failed on False.
+            batch.done.set_result(bool(success))
+            if _last_writes.get(self._device_id) is batch.done:
+                del _last_writes[self._device_id]
@@ -10,6 +10,7 @@ from ..const import (
     DEVICE_TYPE_CHLORINATOR,
     DEVICE_TYPE_LIGHT,
     DEVICE_TYPE_PUMP,
+    PUMP_SCHEDULE_IDS,
     FluidraPoolConfigEntry,
 )
 from ..device_registry import DeviceIdentifier
@@ -53,11 +54,13 @@ async def async_setup_entry(
         entities: list[TimeEntity] = []
         device_id = device["device_id"]
 
+        # Identify once and read features/entities off the config directly.
         config = DeviceIdentifier.identify_device(device)
         device_type = config.device_type if config else device.get("type", "")
+        features = config.features if config else {}
 
         # Heat pumps don't expose schedule controls.
-        if DeviceIdentifier.has_feature(device, "skip_schedules"):
+        if features.get("skip_schedules", False):
             return entities
 
         if device_type == DEVICE_TYPE_LIGHT:
@@ -74,35 +77,35 @@ async def async_setup_entry(
                 for schedule in schedule_data:
                     schedule_id = str(schedule.get("id", ""))
                     if schedule_id:
-                        entities.append(
-                            FluidraLightScheduleStartTimeEntity(
-                                coordinator, coordinator.api, pool_id, device_id, schedule_id
+                        entities.extend(
+                            (
+                                FluidraLightScheduleStartTimeEntity(
+                                    coordinator, coordinator.api, pool_id, device_id, schedule_id
+                                ),
+                                FluidraLightScheduleEndTimeEntity(
+                                    coordinator, coordinator.api, pool_id, device_id, schedule_id
+                                ),
                             )
                         )
-                        entities.append(
-                            FluidraLightScheduleEndTimeEntity(
-                                coordinator, coordinator.api, pool_id, device_id, schedule_id
-                            )
-                        )
-        elif device_type == DEVICE_TYPE_PUMP and DeviceIdentifier.should_create_entity(device, "time"):
+        elif device_type == DEVICE_TYPE_PUMP and config is not None and "time" in config.entities:
             # Pumps: 8 schedulers on component 20.
-            for schedule_id in ["1", "2", "3", "4", "5", "6", "7", "8"]:
-                entities.append(
-                    FluidraScheduleStartTimeEntity(coordinator, coordinator.api, pool_id, device_id, schedule_id)
+            for schedule_id in PUMP_SCHEDULE_IDS:
+                entities.extend(
+                    (
+                        FluidraScheduleStartTimeEntity(coordinator, coordinator.api, pool_id, device_id, schedule_id),
+                        FluidraScheduleEndTimeEntity(coordinator, coordinator.api, pool_id, device_id, schedule_id),
+                    )
                 )
-                entities.append(
-                    FluidraScheduleEndTimeEntity(coordinator, coordinator.api, pool_id, device_id, schedule_id)
-                )
-        elif device_type == DEVICE_TYPE_CHLORINATOR and DeviceIdentifier.has_feature(device, "schedules"):
+        elif device_type == DEVICE_TYPE_CHLORINATOR and features.get("schedules", False):
             # Chlorinators with schedules (e.g., DM24049704).
-            schedule_count = DeviceIdentifier.get_feature(device, "schedule_count", 3)
+            schedule_count = features.get("schedule_count", 3)
             for i in range(1, schedule_count + 1):
                 schedule_id = str(i)
-                entities.append(
-                    FluidraScheduleStartTimeEntity(coordinator, coordinator.api, pool_id, device_id, schedule_id)
-                )
-                entities.append(
-                    FluidraScheduleEndTimeEntity(coordinator, coordinator.api, pool_id, device_id, schedule_id)
+                entities.extend(
+                    (
+                        FluidraScheduleStartTimeEntity(coordinator, coordinator.api, pool_id, device_id, schedule_id),
+                        FluidraScheduleEndTimeEntity(coordinator, coordinator.api, pool_id, device_id, schedule_id),
+                    )
                 )
 
         return entities
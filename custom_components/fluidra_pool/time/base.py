@@ -15,8 +15,8 @@ from ..api_resilience import FluidraError
 from ..const import DEVICE_MODEL_FALLBACK, DEVICE_MODEL_MAP, DOMAIN
 from ..device_registry import DeviceIdentifier
 from ..entity import FluidraPoolControlEntity
-from ..helpers import get_schedule_data, resolve_schedule_component
-from ..utils import extract_cron_days
+from ..helpers import get_schedule_data, parse_cron_time, resolve_schedule_component
+from ..utils import DEFAULT_CRON_ALL_DAYS, extract_cron_days
 
 if TYPE_CHECKING:
     from ..coordinator import FluidraDataUpdateCoordinator
@@ -45,18 +45,10 @@ def parse_schedule_time(time_value: time | int | float | str | None) -> time | N
         return time(hours % 24, mins)
 
     if isinstance(time_value, str):
-        time_value = time_value.strip()
-
-        # Try CRON format "mm HH * * days".
-        parts = time_value.split()
-        if len(parts) >= 2:
-            try:
-                minute = int(parts[0])
-                hour = int(parts[1])
-                if 0 <= hour <= 23 and 0 <= minute <= 59:
-                    return time(hour, minute)
-            except (ValueError, TypeError):
-                pass
+        # CRON format "mm HH * * days" — shares helpers' memoised parser.
+        parsed = parse_cron_time(time_value)
+        if parsed is not None:
+            return parsed
 
         # Try numeric string (minutes from midnight).
         try:
@@ -71,6 +63,15 @@ def parse_schedule_time(time_value: time | int | float | str | None) -> time | N
     return None
 
 
+def _minute_intervals(start_min: int, end_min: int) -> list[tuple[int, int]]:
+    """Split a possibly overnight time range into same-day minute intervals."""
+    if start_min == end_min:
+        return [(0, 24 * 60)]
+    if end_min < start_min:
+        return [(start_min, 24 * 60), (0, end_min)]
+    return [(start_min, end_min)]
+
+
 class _FluidraTimeEntityBase(FluidraPoolControlEntity, TimeEntity):
     """Private base sharing schedule lookup/parsing logic for time entities.
 
@@ -93,16 +94,12 @@ class _FluidraTimeEntityBase(FluidraPoolControlEntity, TimeEntity):
     ) -> None:
         """Initialize the time entity."""
         super().__init__(coordinator, api, pool_id, device_id)
-        self._schedule_id = schedule_id
+        self._schedule_id = str(schedule_id)
         self._time_type = time_type  # "start" or "end"
 
     def _get_schedule_data(self) -> dict[str, Any] | None:
         """Get schedule data from coordinator."""
-        try:
-            return get_schedule_data(self.device_data, self._schedule_id)
-        except (aiohttp.ClientError, TimeoutError, FluidraError, ValueError, TypeError, KeyError, AttributeError):
-            _LOGGER.debug("Failed to get schedule data for %s", self._device_id)
-            return None
+        return get_schedule_data(self.device_data, self._schedule_id)
 
     @property
     def available(self) -> bool:
@@ -114,11 +111,13 @@ class _FluidraTimeEntityBase(FluidraPoolControlEntity, TimeEntity):
         """Handle updated data from the coordinator."""
         self.async_write_ha_state()
 
-    def _parse_cron_time(self, cron_time: time | int | float | str | None) -> time | None:
+    @staticmethod
+    def _parse_cron_time(cron_time: time | int | float | str | None) -> time | None:
         """Parse cron time format or numeric minutes to time object."""
         return parse_schedule_time(cron_time)
 
-    def _format_time_to_cron(self, time_obj: time, days: list[int] | None = None) -> str:
+    @staticmethod
+    def _format_time_to_cron(time_obj: time, days: list[int] | None = None) -> str:
         """Format time object to cron format."""
         if days is None:
             days = [1, 2, 3, 4, 5, 6, 7]  # All days in mobile-app format.
@@ -189,14 +188,15 @@ class FluidraScheduleTimeEntity(_FluidraTimeEntityBase):
                 return True, ""
 
             current_schedules = device_data["schedule_data"]
+            target_id = str(schedule_id_to_update)
             current_schedule = next(
-                (schedule for schedule in current_schedules if str(schedule.get("id")) == str(schedule_id_to_update)),
+                (schedule for schedule in current_schedules if str(schedule.get("id")) == target_id),
                 None,
             )
             new_days = self._get_schedule_days(current_schedule)
 
             for schedule in current_schedules:
-                if str(schedule.get("id")) == str(schedule_id_to_update) or not schedule.get("enabled", False):
+                if str(schedule.get("id")) == target_id or not schedule.get("enabled", False):
                     continue
 
                 if new_days.isdisjoint(self._get_schedule_days(schedule)):
@@ -220,7 +220,8 @@ class FluidraScheduleTimeEntity(_FluidraTimeEntityBase):
             _LOGGER.debug("Failed to validate schedule overlap for %s", self._device_id)
             return True, ""
 
-    def _times_overlap(self, start1: time, end1: time, start2: time, end2: time) -> bool:
+    @staticmethod
+    def _times_overlap(start1: time, end1: time, start2: time, end2: time) -> bool:
         """Check if two time ranges overlap."""
         start1_min = start1.hour * 60 + start1.minute
         end1_min = end1.hour * 60 + end1.minute
@@ -229,22 +230,15 @@ class FluidraScheduleTimeEntity(_FluidraTimeEntityBase):
 
         return any(
             interval1_start < interval2_end and interval2_start < interval1_end
-            for interval1_start, interval1_end in self._minute_intervals(start1_min, end1_min)
-            for interval2_start, interval2_end in self._minute_intervals(start2_min, end2_min)
+            for interval1_start, interval1_end in _minute_intervals(start1_min, end1_min)
+            for interval2_start, interval2_end in _minute_intervals(start2_min, end2_min)
         )
 
-    def _minute_intervals(self, start_min: int, end_min: int) -> list[tuple[int, int]]:
-        """Split a possibly overnight time range into same-day minute intervals."""
-        if start_min == end_min:
-            return [(0, 24 * 60)]
-        if end_min < start_min:
-            return [(start_min, 24 * 60), (0, end_min)]
-        return [(start_min, end_min)]
-
-    def _format_cron_time_chlorinator(self, cron_time: str) -> str:
+    @staticmethod
+    def _format_cron_time_chlorinator(cron_time: str) -> str:
         """Format CRON time for DM24049704 chlorinator (00 05 * * 1,2,3,4,5,6,7)."""
         if not cron_time:
-            return "00 00 * * 1,2,3,4,5,6,7"
+            return DEFAULT_CRON_ALL_DAYS
         parts = cron_time.split()
         if len(parts) >= 5:
             minute = parts[0].zfill(2)
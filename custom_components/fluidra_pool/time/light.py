@@ -12,6 +12,7 @@ from homeassistant.exceptions import HomeAssistantError
 
 from ..api_resilience import FluidraError
 from ..const import DOMAIN
+from ..utils import DEFAULT_CRON_ALL_DAYS, DEFAULT_CRON_END_ALL_DAYS
 from .base import FluidraLightScheduleTimeEntity
 
 if TYPE_CHECKING:
@@ -68,10 +69,10 @@ class FluidraLightScheduleStartTimeEntity(FluidraLightScheduleTimeEntity):
 
             updated_schedules = []
             for sched in current_schedules:
-                start_time = sched.get("startTime", "00 00 * * 1,2,3,4,5,6,7")
-                end_time = sched.get("endTime", "00 01 * * 1,2,3,4,5,6,7")
+                start_time = sched.get("startTime", DEFAULT_CRON_ALL_DAYS)
+                end_time = sched.get("endTime", DEFAULT_CRON_END_ALL_DAYS)
 
-                if str(sched.get("id")) == str(self._schedule_id):
+                if str(sched.get("id")) == self._schedule_id:
                     days = [1, 2, 3, 4, 5, 6, 7]
                     if start_time:
                         parts = start_time.split()
@@ -97,7 +98,7 @@ class FluidraLightScheduleStartTimeEntity(FluidraLightScheduleTimeEntity):
                 raise HomeAssistantError(
                     translation_domain=DOMAIN,
                     translation_key="light_schedule_set_failed",
-                    translation_placeholders={"schedule_id": str(self._schedule_id)},
+                    translation_placeholders={"schedule_id": self._schedule_id},
                 )
             await self.coordinator.async_request_refresh()
 
@@ -116,7 +117,7 @@ class FluidraLightScheduleStartTimeEntity(FluidraLightScheduleTimeEntity):
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="light_schedule_set_failed",
-                translation_placeholders={"schedule_id": str(self._schedule_id)},
+                translation_placeholders={"schedule_id": self._schedule_id},
             ) from err
 
 
@@ -167,10 +168,10 @@ class FluidraLightScheduleEndTimeEntity(FluidraLightScheduleTimeEntity):
 
             updated_schedules = []
             for sched in current_schedules:
-                start_time = sched.get("startTime", "00 00 * * 1,2,3,4,5,6,7")
-                end_time = sched.get("endTime", "00 01 * * 1,2,3,4,5,6,7")
+                start_time = sched.get("startTime", DEFAULT_CRON_ALL_DAYS)
+                end_time = sched.get("endTime", DEFAULT_CRON_END_ALL_DAYS)
 
-                if str(sched.get("id")) == str(self._schedule_id):
+                if str(sched.get("id")) == self._schedule_id:
                     days = [1, 2, 3, 4, 5, 6, 7]
                     if end_time:
                         parts = end_time.split()
@@ -196,7 +197,7 @@ class FluidraLightScheduleEndTimeEntity(FluidraLightScheduleTimeEntity):
                 raise HomeAssistantError(
                     translation_domain=DOMAIN,
                     translation_key="light_schedule_set_failed",
-                    translation_placeholders={"schedule_id": str(self._schedule_id)},
+                    translation_placeholders={"schedule_id": self._schedule_id},
                 )
             await self.coordinator.async_request_refresh()
 
@@ -215,5 +216,5 @@ class FluidraLightScheduleEndTimeEntity(FluidraLightScheduleTimeEntity):
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="light_schedule_set_failed",
-                translation_placeholders={"schedule_id": str(self._schedule_id)},
+                translation_placeholders={"schedule_id": self._schedule_id},
             ) from err
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
 # Default CRON expression for all days (Mon-Sun in mobile format)
 DEFAULT_CRON_ALL_DAYS = "00 00 * * 1,2,3,4,5,6,7"
+# Default end time paired with DEFAULT_CRON_ALL_DAYS (one minute later)
+DEFAULT_CRON_END_ALL_DAYS = "00 01 * * 1,2,3,4,5,6,7"
 MOBILE_CRON_DAYS = (1, 2, 3, 4, 5, 6, 7)
 
 # CRON day number → weekday name (Fluidra mobile-app format: 1=Monday, 7=Sunday)
@@ -67,20 +70,22 @@ def extract_cron_days(cron_time: str | None) -> set[int]:
     return days or set(MOBILE_CRON_DAYS)
 
 
+@lru_cache(maxsize=64)
 def convert_cron_days(cron_time: str) -> str:
-    """Convert cron day numbers from HA format (0=Sun..6=Sat) to mobile format (1=Mon..7=Sun)."""
+    """Convert cron day numbers from HA format (0=Sun..6=Sat) to mobile format (1=Mon..7=Sun).
+
+    Memoised: the same handful of cron strings is rewritten on every schedule
+    edit, and the result depends only on the input string.
+    """
     if not cron_time:
         return DEFAULT_CRON_ALL_DAYS
 
     parts = cron_time.split()
     if len(parts) >= 5:
         try:
-            old_days = parts[4].split(",")
-            new_days: list[int] = []
-            for day in old_days:
-                day_num = int(day.strip())
-                new_days.append(7 if day_num == 0 else day_num)
-            parts[4] = ",".join(str(d) for d in sorted(new_days))
+            # Only Sunday moves (0 -> 7); mobile-format days pass through unchanged.
+            new_days = sorted(int(day) or 7 for day in parts[4].split(","))
+            parts[4] = ",".join(map(str, new_days))
             return " ".join(parts)
         except (ValueError, IndexError) as err:
             _LOGGER.debug("Failed to convert CRON days '%s': %s", cron_time, err)
@@ -176,12 +176,12 @@ async def test_target_temperature_optimistic_expires_after_timeout() -> None:
     api = _api()
     climate = _make(_pin(target_temperature=29.0), api)
     with patch(TIME_MOD) as mock_time:
-        mock_time.time.return_value = 1000.0
+        mock_time.monotonic.return_value = 1000.0
         await climate.async_set_temperature(**{ATTR_TEMPERATURE: 31.0})
         # Device keeps reporting 29 (clamped / changed elsewhere) → optimistic value shown.
         assert climate.target_temperature == 31.0
         # 6 seconds later the fallback expiry releases the stale optimistic value.
-        mock_time.time.return_value = 1006.0
+        mock_time.monotonic.return_value = 1006.0
         assert climate.target_temperature == 29.0
         assert climate._pending_temperature is None
 
@@ -287,7 +287,7 @@ def test_preset_mode_pending_optimistic_within_window() -> None:
     with patch(TIME_MOD) as mock_time:
         # action time = 1000, now = 1003 (< 5s) -> keep optimistic
         climate._last_preset_action_time = 1000.0
-        mock_time.time.return_value = 1003.0
+        mock_time.monotonic.return_value = 1003.0
         assert climate.preset_mode == "boost"
 
 
@@ -296,7 +296,7 @@ def test_preset_mode_pending_optimistic_expires() -> None:
     climate._pending_preset_mode = "boost"
     with patch(TIME_MOD) as mock_time:
         climate._last_preset_action_time = 1000.0
-        mock_time.time.return_value = 1010.0  # > 5s -> expire, fall through
+        mock_time.monotonic.return_value = 1010.0  # > 5s -> expire, fall through
         assert climate.preset_mode is None  # Z550 has no controllable preset (Issue #88)
     assert climate._pending_preset_mode is None
     assert climate._last_preset_action_time is None
@@ -331,7 +331,7 @@ def test_hvac_mode_pending_optimistic_window() -> None:
     climate._pending_hvac_mode = HVACMode.COOL
     with patch(TIME_MOD) as mock_time:
         climate._last_hvac_action_time = 1000.0
-        mock_time.time.return_value = 1002.0
+        mock_time.monotonic.return_value = 1002.0
         assert climate.hvac_mode == HVACMode.COOL
 
 
@@ -340,7 +340,7 @@ def test_hvac_mode_pending_optimistic_expires() -> None:
     climate._pending_hvac_mode = HVACMode.COOL
     with patch(TIME_MOD) as mock_time:
         climate._last_hvac_action_time = 1000.0
-        mock_time.time.return_value = 1010.0
+        mock_time.monotonic.return_value = 1010.0
         assert climate.hvac_mode == HVACMode.HEAT  # falls through to reported true
     assert climate._pending_hvac_mode is None
 
@@ -73,6 +73,14 @@ class TestAsyncUpdateData:
         assert "pool_001" in result
         assert len(result) == 1
 
+    async def test_pools_carry_device_index(self, coordinator: FluidraDataUpdateCoordinator, mock_api: AsyncMock):
+        """Each pool exposes its devices by id so entities skip the linear scan."""
+        device = {"device_id": "PUMP-1", "name": "Pump"}
+        mock_api.ensure_valid_token.return_value = True
+        mock_api.get_pools.return_value = [{"id": "pool_001", "devices": [device]}]
+        result = await coordinator._async_update_data()
+        assert result["pool_001"]["_devices_by_id"] == {"PUMP-1": device}
+
     async def test_second_update_fetches_components(
         self, coordinator: FluidraDataUpdateCoordinator, mock_api: AsyncMock
     ):
@@ -225,6 +225,7 @@ async def test_component_40_light_schedule_data(coordinator: FluidraDataUpdateCo
     schedule = [{"id": 1, "startTime": "0 8 * * 1,2,3", "enabled": True}]
     coordinator._process_component_state(device, "pool_001", 40, {"reportedValue": schedule})
     assert device["schedule_data"] == schedule
+    assert device["_schedules_by_id"] == {"1": schedule[0]}
 
 
 @pytest.mark.parametrize(
@@ -7,6 +7,7 @@ from custom_components.fluidra_pool.device_registry import (
     DeviceConfig,
     DeviceIdentifier,
 )
+from custom_components.fluidra_pool.device_registry.identifier import _compile_patterns, _matches_any
 
 
 class TestDeviceConfig:
@@ -638,6 +639,12 @@ class TestMatchesPattern:
     def test_multiple_patterns_any_match(self):
         assert DeviceIdentifier._matches_pattern("E30-pump", ["VS*", "E30*", "LE*"]) is True
 
+    def test_compiled_plain_pattern_matches_as_substring_of_value(self):
+        """Precompiled plain patterns test ``pattern in value``, never the reverse."""
+        matchers = _compile_patterns(["Victoria"])
+        assert _matches_any("victoria smart connect", matchers) is True
+        assert _matches_any("vic", matchers) is False
+
 
 class TestIdentifyDevice:
     """Test DeviceIdentifier.identify_device."""
@@ -110,6 +110,25 @@ def test_redact_pools_data_redacts_inner_pool_id() -> None:
     assert redacted[pool_key]["name"] == "Family Pool"
 
 
+def test_redact_pools_data_drops_device_index() -> None:
+    """The coordinator's device index is keyed by raw serials and must not be dumped."""
+    device = {"device_id": "SERIAL-123", "name": "Pump"}
+    redacted = _redact_pools_data({"pool-1": {"devices": [device], "_devices_by_id": {"SERIAL-123": device}}})
+    pool = next(iter(redacted.values()))
+    assert "_devices_by_id" not in pool
+    assert "SERIAL-123" not in str(redacted)
+
+
+def test_redact_devices_data_drops_schedule_index() -> None:
+    """The coordinator's schedule index mirrors schedule_data and must not be dumped twice."""
+    slot = {"id": 1, "enabled": True, "startTime": "00 08 * * 1"}
+    redacted = _redact_devices_data(
+        [{"device_id": "SERIAL-123", "schedule_data": [slot], "_schedules_by_id": {"1": slot}}]
+    )
+    assert "_schedules_by_id" not in redacted[0]
+    assert redacted[0]["schedule_data"] == [slot]
+
+
 def test_redact_pools_data_handles_non_dict_pool_payloads() -> None:
     """A non-dict pool payload is forwarded as-is (defensive fallback)."""
     redacted = _redact_pools_data({"pool-abc": "unexpected"})
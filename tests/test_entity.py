@@ -145,3 +145,19 @@ def test_available_false_when_device_vanished() -> None:
     coordinator.data = {"pool_1": {"devices": []}}
     entity = FluidraPoolEntity(coordinator, "pool_1", "DEV-1")
     assert entity.available is False
+
+
+def test_device_data_is_resolved_once_per_coordinator_snapshot() -> None:
+    """Repeated reads reuse the resolved device until the coordinator publishes new data."""
+    coordinator = MagicMock()
+    old = {"device_id": "DEV-1", "name": "Old"}
+    coordinator.data = {"pool_1": {"devices": [old]}}
+    entity = FluidraPoolEntity(coordinator, "pool_1", "DEV-1")
+    assert entity.device_data is old
+
+    coordinator.data["pool_1"]["devices"] = []
+    assert entity.device_data is old  # same snapshot, lookup not redone
+
+    new = {"device_id": "DEV-1", "name": "New"}
+    coordinator.data = {"pool_1": {"devices": [new]}}
+    assert entity.device_data is new
@@ -532,6 +532,7 @@ async def test_chlorinator_boost_turn_on_returns_false_clears_pending() -> None:
 
 async def test_chlorinator_boost_turn_off_api_raises_clears_pending() -> None:
     device = _chlorinator_device({"skip_mode_select": True})
+    device["components"] = {"245": {"reportedValue": True}}  # boosting, so OFF is a real change
     api = _api(control_device_component=AsyncMock(side_effect=FluidraConnectionError("boom")))
     entity = FluidraChlorinatorBoostSwitch(_coordinator([device]), api, POOL_ID, DEVICE_ID)
     _attach_ha(entity)
@@ -542,6 +543,7 @@ async def test_chlorinator_boost_turn_off_api_raises_clears_pending() -> None:
 
 async def test_chlorinator_boost_turn_off_returns_false_clears_pending() -> None:
     device = _chlorinator_device({"skip_mode_select": True})
+    device["components"] = {"245": {"reportedValue": True}}  # boosting, so OFF is a real change
     coordinator = _coordinator([device])
     api = _api(control_device_component=AsyncMock(return_value=False))
     entity = FluidraChlorinatorBoostSwitch(coordinator, api, POOL_ID, DEVICE_ID)
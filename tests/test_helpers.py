@@ -8,8 +8,11 @@ import pytest
 
 from custom_components.fluidra_pool.helpers import (
     get_schedule_data,
+    index_devices,
+    index_schedules,
     parse_cron_time,
     resolve_component_rw,
+    schedule_operation_name,
 )
 
 # --- get_schedule_data ----------------------------------------------------
@@ -28,6 +31,32 @@ def test_get_schedule_data_returns_none_when_absent() -> None:
     assert get_schedule_data({"schedule_data": [{"id": 9}]}, 1) is None
 
 
+def test_get_schedule_data_tolerates_malformed_payloads() -> None:
+    assert get_schedule_data({"schedule_data": 123}, 1) is None
+    assert get_schedule_data({"schedule_data": [None, "x", {"id": 1}]}, 1) == {"id": 1}
+    assert get_schedule_data(["not", "a", "dict"], 1) is None  # type: ignore[arg-type]
+
+
+def test_index_schedules_keys_by_string_id_first_wins() -> None:
+    first = {"id": 1, "enabled": True}
+    index = index_schedules([first, {"id": "1", "enabled": False}, "garbage", {"id": 2}])
+    assert index == {"1": first, "2": {"id": 2}}
+
+
+def test_get_schedule_data_uses_index_when_present() -> None:
+    """The coordinator-built index answers the lookup without rescanning."""
+    schedules = [{"id": 1, "enabled": True}]
+    device = {"schedule_data": schedules, "_schedules_by_id": {"1": {"id": 1, "enabled": False}}}
+    assert get_schedule_data(device, 1) == {"id": 1, "enabled": False}
+    assert get_schedule_data(device, 2) is None
+
+
+def test_index_devices_skips_missing_ids_first_wins() -> None:
+    first = {"device_id": "A", "name": "one"}
+    index = index_devices([first, {"device_id": "A", "name": "two"}, {"name": "no id"}, "garbage"])
+    assert index == {"A": first}
+
+
 # --- resolve_component_rw ---------------------------------------------------
 
 
@@ -66,6 +95,11 @@ def test_parse_cron_time_invalid_returns_none(invalid) -> None:
     assert parse_cron_time(invalid) is None  # type: ignore[arg-type]
 
 
+def test_parse_cron_time_unhashable_input_returns_none() -> None:
+    """The memoised path only sees strings; anything else still maps to None."""
+    assert parse_cron_time(["30", "08"]) is None  # type: ignore[arg-type]
+
+
 # --- determine_pool_access --------------------------------------------------
 
 
@@ -128,3 +162,10 @@ def test_pool_access_unknown_without_contracts() -> None:
 
     assert determine_pool_access({"owner": "x"}, None) == "unknown"
     assert determine_pool_access({}, "user-1") == "unknown"
+
+
+def test_schedule_operation_name_defaults_and_stringifies() -> None:
+    assert schedule_operation_name({"startActions": {"operationName": "2"}}) == "2"
+    assert schedule_operation_name({"startActions": {"operationName": 3}}) == "3"
+    assert schedule_operation_name({}) == "0"
+    assert schedule_operation_name({"startActions": {}}, "1") == "1"
@@ -0,0 +1,114 @@
+"""Concurrent schedule toggles on one device go out as a single write.
+
+``set_schedule`` replaces the device's whole schedule list, so two slots toggled
+at once (a scene, an automation with several actions) used to each POST their
+own copy and the second silently reverted the first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.fluidra_pool.switch.schedule import FluidraScheduleEnableSwitch, _with_overrides
+
+POOL_ID = "pool-1"
+DEVICE_ID = "PUMP-1"
+
+
+def _switches(schedules: list[dict[str, Any]], set_schedule: AsyncMock) -> list[FluidraScheduleEnableSwitch]:
+    device = {"device_id": DEVICE_ID, "type": "pump", "online": True, "schedule_data": schedules}
+    coordinator = MagicMock()
+    coordinator.data = {POOL_ID: {"id": POOL_ID, "devices": [device]}}
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator.last_update_success = True
+    api = SimpleNamespace(set_schedule=set_schedule)
+    switches = []
+    for sched in schedules:
+        switch = FluidraScheduleEnableSwitch(coordinator, api, POOL_ID, DEVICE_ID, schedule_id=str(sched["id"]))
+        switch.hass = MagicMock()
+        switch.async_write_ha_state = MagicMock()
+        switches.append(switch)
+    return switches
+
+
+def test_with_overrides_flips_only_listed_slots() -> None:
+    updated = _with_overrides([{"id": 1, "enabled": False}, {"id": 2, "enabled": True}], {"1": True})
+    assert updated == [{"id": 1, "groupId": 1, "enabled": True}, {"id": 2, "groupId": 2, "enabled": True}]
+
+
+async def test_same_tick_toggles_share_one_write() -> None:
+    set_schedule = AsyncMock(return_value=True)
+    one, two, three = _switches(
+        [{"id": 1, "enabled": False}, {"id": 2, "enabled": True}, {"id": 3, "enabled": False}], set_schedule
+    )
+
+    await asyncio.gather(one.async_turn_on(), two.async_turn_off(), three.async_turn_on())
+
+    set_schedule.assert_awaited_once()
+    sent = set_schedule.call_args.args[1]
+    assert {s["id"]: s["enabled"] for s in sent} == {1: True, 2: False, 3: True}
+
+
+async def test_failed_batch_fails_every_toggle() -> None:
+    set_schedule = AsyncMock(return_value=False)
+    one, two = _switches([{"id": 1, "enabled": False}, {"id": 2, "enabled": False}], set_schedule)
+
+    results = await asyncio.gather(one.async_turn_on(), two.async_turn_on(), return_exceptions=True)
+
+    set_schedule.assert_awaited_once()
+    assert all(isinstance(r, HomeAssistantError) for r in results)
+    assert one._pending_state is None
+    assert two._pending_state is None
+
+
+async def test_sequential_toggles_are_not_held_back() -> None:
+    set_schedule = AsyncMock(return_value=True)
+    one, _two = _switches([{"id": 1, "enabled": False}, {"id": 2, "enabled": False}], set_schedule)
+
+    await one.async_turn_on()
+    await one.async_turn_off()
+
+    assert set_schedule.await_count == 2
+
+
+async def test_successful_write_patches_cached_schedules() -> None:
+    """A second toggle before the next poll must build on the first one's result."""
+    set_schedule = AsyncMock(return_value=True)
+    one, two = _switches([{"id": 1, "enabled": False}, {"id": 2, "enabled": False}], set_schedule)
+
+    await one.async_turn_on()
+    await two.async_turn_on()
+
+    sent = set_schedule.call_args.args[1]
+    assert {s["id"]: s["enabled"] for s in sent} == {1: True, 2: True}
+    assert one.is_on is True
+
+
+async def test_toggle_during_inflight_write_waits_and_builds_on_it() -> None:
+    """A toggle issued while another write is on the wire must not use the old snapshot."""
+    release = asyncio.Event()
+
+    async def slow_write(*_args: Any, **_kwargs: Any) -> bool:
+        await release.wait()
+        return True
+
+    set_schedule = AsyncMock(side_effect=slow_write)
+    one, two = _switches([{"id": 1, "enabled": False}, {"id": 2, "enabled": False}], set_schedule)
+
+    first = asyncio.create_task(one.async_turn_on())
+    while set_schedule.await_count == 0:
+        await asyncio.sleep(0)
+    second = asyncio.create_task(two.async_turn_on())
+    await asyncio.sleep(0)
+    assert set_schedule.await_count == 1  # queued behind the first write
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    sent = set_schedule.await_args_list[1].args[1]
+    assert {s["id"]: s["enabled"] for s in sent} == {1: True, 2: True}
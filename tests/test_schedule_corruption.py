@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from custom_components.fluidra_pool.switch.schedule import _with_enabled
+from custom_components.fluidra_pool.switch.schedule import _with_overrides
 
 # An eXO iQ slot as the API actually returns it: the mode lives in
 # componentActions, and the cron days are already in the API's own numbering.
@@ -41,7 +41,7 @@ def test_enabling_preserves_component_actions_mode() -> None:
     Previously `startActions` was rebuilt as `operationName` with a "0" default,
     so the real mode was silently replaced by 0 on every toggle.
     """
-    [updated] = _with_enabled([EXO_SLOT], 1, True)
+    [updated] = _with_overrides([EXO_SLOT], {"1": True})
     assert updated["startActions"] == {"componentActions": [{"id": 0, "reportedValue": 1}]}
 
 
@@ -51,21 +51,21 @@ def test_enabling_preserves_cron_days_verbatim() -> None:
     They used to be run through a 0→7 day conversion on every write, even though
     the values came straight from the API in its own format — shifting the days.
     """
-    [updated] = _with_enabled([EXO_SLOT], 1, True)
+    [updated] = _with_overrides([EXO_SLOT], {"1": True})
     assert updated["startTime"] == "00 08 * * 0,1,2,3,4,5,6"
     assert updated["endTime"] == "00 12 * * 0,1,2,3,4,5,6"
 
 
 def test_only_the_targeted_slot_changes() -> None:
     """Toggling one slot must leave the others byte-identical."""
-    updated = _with_enabled([EXO_SLOT, LEGACY_SLOT], 2, True)
+    updated = _with_overrides([EXO_SLOT, LEGACY_SLOT], {"2": True})
     assert updated[0] == EXO_SLOT  # untouched
     assert updated[1]["enabled"] is True
     assert updated[1]["startActions"] == {"operationName": "2"}  # mode preserved
 
 
 def test_disabling_only_flips_the_flag() -> None:
-    updated = _with_enabled([EXO_SLOT], 1, False)
+    updated = _with_overrides([EXO_SLOT], {"1": False})
     assert updated[0]["enabled"] is False
     assert {k: v for k, v in updated[0].items() if k != "enabled"} == {
         k: v for k, v in EXO_SLOT.items() if k != "enabled"
@@ -75,21 +75,21 @@ def test_disabling_only_flips_the_flag() -> None:
 def test_unknown_fields_are_carried_through() -> None:
     """Fields we don't know about must not be dropped — that's what broke this."""
     slot = {**EXO_SLOT, "someFutureField": {"nested": True}}
-    [updated] = _with_enabled([slot], 1, True)
+    [updated] = _with_overrides([slot], {"1": True})
     assert updated["someFutureField"] == {"nested": True}
     assert updated["state"] == "IDLE"
 
 
 def test_group_id_defaults_to_id_when_absent() -> None:
     """The API rejects a payload without groupId, so mirror id when missing."""
-    [updated] = _with_enabled([{"id": 3, "enabled": False}], 3, True)
+    [updated] = _with_overrides([{"id": 3, "enabled": False}], {"3": True})
     assert updated["groupId"] == 3
 
 
 def test_source_schedules_are_not_mutated() -> None:
     """The coordinator's cached data must not be edited in place."""
     original = dict(EXO_SLOT)
-    _with_enabled([EXO_SLOT], 1, False)
+    _with_overrides([EXO_SLOT], {"1": False})
     assert EXO_SLOT == original
 
 
@@ -9,13 +9,14 @@ identify the live one.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
 from custom_components.fluidra_pool.device_registry import DEVICE_CONFIGS, DeviceIdentifier
-from custom_components.fluidra_pool.helpers import resolve_schedule_component
+from custom_components.fluidra_pool.helpers import index_schedules, resolve_schedule_component
 
 SLOT = {"id": 1, "groupId": 1, "state": "IDLE", "enabled": True, "startTime": "07 10 * * 1,2"}
 
@@ -75,7 +76,9 @@ def _apply(device: dict[str, Any]) -> dict[str, Any]:
 
     coordinator = MagicMock()
     coordinator._track_schedule_count = MagicMock()
+    coordinator._store_schedule_data = partial(FluidraDataUpdateCoordinator._store_schedule_data, coordinator)
     FluidraDataUpdateCoordinator._apply_resolved_schedule(coordinator, device, "pool-1", device["device_id"])
+    assert device["_schedules_by_id"] == index_schedules(device["schedule_data"])
     return device
 
 
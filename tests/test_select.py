@@ -267,7 +267,7 @@ def test_light_effect_optimistic_option_takes_precedence() -> None:
     """A pending, unexpired optimistic option overrides the reported component value."""
     select = _light_effect(0)  # device reports static_color
     select._optimistic_option = "scene_7"
-    select._optimistic_time = time.time()
+    select._optimistic_time = time.monotonic()
     assert select.current_option == "scene_7"
 
 
@@ -275,7 +275,7 @@ def test_light_effect_optimistic_option_expires() -> None:
     """An expired optimistic option falls back to the reported value."""
     select = _light_effect(0)
     select._optimistic_option = "scene_7"
-    select._optimistic_time = time.time() - (OPTIMISTIC_ACTION_TIMEOUT + 5)
+    select._optimistic_time = time.monotonic() - (OPTIMISTIC_ACTION_TIMEOUT + 5)
     assert select.current_option == "static_color"
 
 
@@ -283,7 +283,7 @@ def test_light_effect_coordinator_update_confirms_optimistic() -> None:
     """The optimistic option is dropped once the backend reports it."""
     select = _light_effect(7)  # device now reports scene_7
     select._optimistic_option = "scene_7"
-    select._optimistic_time = time.time()
+    select._optimistic_time = time.monotonic()
     with patch(
         "homeassistant.helpers.update_coordinator.CoordinatorEntity._handle_coordinator_update",
         lambda self: None,
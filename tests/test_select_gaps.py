@@ -376,14 +376,14 @@ def test_chlor_get_api_mode_falls_back_to_mode_reported() -> None:
 def test_chlor_optimistic_not_expired_recent() -> None:
     """A just-set optimistic timestamp is not expired."""
     select = _chlor()
-    select._optimistic_time = time.time()
+    select._optimistic_time = time.monotonic()
     assert select._optimistic_expired() is False
 
 
 def test_chlor_optimistic_expired_old() -> None:
     """A timestamp older than OPTIMISTIC_TIMEOUT is expired."""
     select = _chlor()
-    select._optimistic_time = time.time() - (CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT + 10)
+    select._optimistic_time = time.monotonic() - (CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT + 10)
     assert select._optimistic_expired() is True
 
 
@@ -394,7 +394,7 @@ def test_chlor_current_option_optimistic_not_expired() -> None:
     """Recent optimistic value wins over API mode."""
     select = _chlor({"20": {"reportedValue": 0}})  # api would say off
     select._optimistic_option = "auto"
-    select._optimistic_time = time.time()
+    select._optimistic_time = time.monotonic()
     assert select.current_option == "auto"
 
 
@@ -402,7 +402,7 @@ def test_chlor_current_option_optimistic_expired_uses_api() -> None:
     """An expired optimistic value is ignored; API mode is returned."""
     select = _chlor({"20": {"reportedValue": 1}})  # api: on
     select._optimistic_option = "auto"
-    select._optimistic_time = time.time() - (CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT + 10)
+    select._optimistic_time = time.monotonic() - (CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT + 10)
     assert select.current_option == "on"
 
 
@@ -420,7 +420,7 @@ def test_chlor_handle_update_clears_when_api_confirms() -> None:
     """Optimistic value cleared once API mode matches it."""
     select = _chlor({"20": {"reportedValue": 2}})  # api: auto
     select._optimistic_option = "auto"
-    select._optimistic_time = time.time()
+    select._optimistic_time = time.monotonic()
     select._handle_coordinator_update()
     assert select._optimistic_option is None
     select.async_write_ha_state.assert_called()
@@ -430,7 +430,7 @@ def test_chlor_handle_update_clears_when_expired() -> None:
     """Optimistic value cleared once it expires even if API disagrees."""
     select = _chlor({"20": {"reportedValue": 1}})  # api: on (≠ auto)
     select._optimistic_option = "auto"
-    select._optimistic_time = time.time() - (CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT + 10)
+    select._optimistic_time = time.monotonic() - (CHLORINATOR_MODE_OPTIMISTIC_TIMEOUT + 10)
     select._handle_coordinator_update()
     assert select._optimistic_option is None
 
@@ -439,7 +439,7 @@ def test_chlor_handle_update_keeps_when_unconfirmed_and_fresh() -> None:
     """Optimistic value kept while API still disagrees and it hasn't expired."""
     select = _chlor({"20": {"reportedValue": 1}})  # api: on (≠ auto)
     select._optimistic_option = "auto"
-    select._optimistic_time = time.time()
+    select._optimistic_time = time.monotonic()
     select._handle_coordinator_update()
     assert select._optimistic_option == "auto"
 
@@ -440,8 +440,8 @@ def test_format_cron_time_returns_input_when_too_few_parts() -> None:
 
 
 def test_schedule_mode_get_schedule_data_swallows_malformed_schedule() -> None:
-    """A non-dict entry in schedule_data triggers the guarded except → None."""
-    device = _pump_device(["not-a-dict"])  # schedule.get(...) raises AttributeError
+    """A non-dict entry in schedule_data is skipped → None."""
+    device = _pump_device(["not-a-dict"])  # malformed entry, skipped by the lookup
     select = FluidraScheduleModeSelect(_coord(device), _api(), POOL_ID, PUMP_ID, schedule_id="1")
     _attach_ha(select)
     assert select._get_schedule_data() is None
@@ -489,8 +489,8 @@ def test_schedule_mode_extra_state_attributes_without_schedule() -> None:
 
 
 def test_chlor_schedule_speed_get_schedule_data_swallows_malformed_schedule() -> None:
-    """A non-dict schedule entry hits the guarded except → None (so unavailable)."""
-    device = _chlor_device(schedule_data=[None])  # schedule.get(...) raises AttributeError
+    """A non-dict schedule entry is skipped → None (so unavailable)."""
+    device = _chlor_device(schedule_data=[None])  # malformed entry, skipped by the lookup
     select = FluidraChlorinatorScheduleSpeedSelect(_coord(device), _api(), POOL_ID, CHLOR_ID, schedule_id="1")
     _attach_ha(select)
     assert select._get_schedule_data() is None
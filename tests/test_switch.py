@@ -97,6 +97,31 @@ def test_pump_pending_state_overrides_actual_until_expiry() -> None:
     assert pump.is_on is True
 
 
+def test_pending_state_writes_only_on_change() -> None:
+    """A repeated command or a redundant clear must not write HA state again."""
+    pump = _pump_switch({"is_running": False})
+    pump._set_pending_state(True)
+    first_action = pump._last_action_time
+    pump._set_pending_state(True)
+    assert pump._last_action_time >= first_action
+    pump._clear_pending_state()
+    pump._clear_pending_state()
+    assert pump.async_write_ha_state.call_count == 2
+
+
+def test_action_timestamp_is_wall_clock() -> None:
+    """The action_timestamp attribute is epoch time; the timeout uses the monotonic clock."""
+    pump = _pump_switch({"is_running": False})
+    with patch("custom_components.fluidra_pool.switch.base.time") as mock_time:
+        mock_time.monotonic.return_value = 42.0
+        mock_time.time.return_value = 1_700_000_000.0
+        pump._set_pending_state(True)
+    assert pump._last_action_time == 42.0
+    assert pump.extra_state_attributes["action_timestamp"] == 1_700_000_000.0
+    pump._clear_pending_state()
+    assert pump.extra_state_attributes["action_timestamp"] is None
+
+
 async def test_pump_turn_on_invokes_start_pump_and_refresh() -> None:
     """Successful turn_on issues start_pump and asks the coordinator to refresh."""
     pump = _pump_switch()
@@ -410,7 +435,7 @@ def test_auto_mode_victoria_holds_optimistic_state_past_default_timeout() -> Non
     auto = _auto({"auto_reported": 0})  # cloud still says off
     auto._set_pending_state(True)  # user just switched it on
     # Simulate the default timeout having elapsed but the pump still priming.
-    auto._last_action_time = time.time() - (OPTIMISTIC_ACTION_TIMEOUT + 5)
+    auto._last_action_time = time.monotonic() - (OPTIMISTIC_ACTION_TIMEOUT + 5)
 
     with patch(
         "custom_components.fluidra_pool.switch.pump.DeviceIdentifier.has_feature",
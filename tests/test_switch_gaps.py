@@ -278,6 +278,30 @@ def test_boost_is_on_default_component() -> None:
     assert _boost(device).is_on is True
 
 
+def test_boost_component_follows_profile_resolved_after_setup() -> None:
+    """A tecnoLC2 unit set up before c8/c172 are scanned must move to register 103."""
+    device = {
+        "device_id": "CC29999999.nn_1",
+        "name": "Chlorinator",
+        "family": "Chlorinators",
+        "model": "",
+        "type": "chlorinator",
+        "online": True,
+        "components": {},
+    }
+    entity = FluidraChlorinatorBoostSwitch(_coordinator([device]), _api(), POOL_ID, device["device_id"])
+    _attach_ha(entity)
+    assert entity._boost_component == 245  # generic catch-all until the signature is seen
+
+    device["components"] = {
+        "8": {"reportedValue": 0},
+        "172": {"reportedValue": 303},
+        "103": {"reportedValue": True},
+    }
+    assert entity._boost_component == 103
+    assert entity.is_on is True
+
+
 def test_boost_pending_state_shows_through() -> None:
     """Optimistic boost ON shows even while the component still reports off."""
     device = _chlorinator_device(components={"245": {"reportedValue": False}})
@@ -422,7 +446,7 @@ async def test_boost_turn_on_returns_false_reverts() -> None:
 
 async def test_boost_turn_off_success() -> None:
     """Boost OFF writes False to the boost component and refreshes."""
-    device = _chlorinator_device(features={"boost_mode": 245})
+    device = _chlorinator_device(features={"boost_mode": 245}, components={"245": {"reportedValue": True}})
     entity = _boost(device)
     await entity.async_turn_off()
     entity._api.control_device_component.assert_awaited_once_with(DEVICE_ID, 245, False)
@@ -432,7 +456,7 @@ async def test_boost_turn_off_success() -> None:
 
 async def test_boost_turn_off_returns_false_reverts() -> None:
     """API False on boost OFF clears the optimistic state, raises, no refresh."""
-    device = _chlorinator_device(features={"boost_mode": 245})
+    device = _chlorinator_device(features={"boost_mode": 245}, components={"245": {"reportedValue": True}})
     entity = _boost(device, control_device_component=AsyncMock(return_value=False))
     with pytest.raises(HomeAssistantError):
         await entity.async_turn_off()
@@ -440,6 +464,19 @@ async def test_boost_turn_off_returns_false_reverts() -> None:
     entity.coordinator.async_request_refresh.assert_not_awaited()
 
 
+@pytest.mark.parametrize(("reported", "method"), [(True, "async_turn_on"), (False, "async_turn_off")])
+async def test_boost_skips_write_when_already_in_requested_state(reported: bool, method: str) -> None:
+    """A redundant command sends nothing and does not wait for confirmation."""
+    device = _chlorinator_device(
+        features={"skip_mode_select": True, "boost_mode": 245}, components={"245": {"reportedValue": reported}}
+    )
+    entity = _boost(device)
+    await getattr(entity, method)()
+    entity._api.control_device_component.assert_not_awaited()
+    entity.coordinator.async_request_refresh.assert_not_awaited()
+    assert entity._pending_state is None
+
+
 # =========================================================================
 # FluidraHeatPumpSwitch
 # =========================================================================
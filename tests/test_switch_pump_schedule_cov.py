@@ -13,7 +13,7 @@ pump.py
 
 schedule.py
 * icon OFF branch
-* _get_schedule_data: empty device_data -> None, and the exception handler
+* _get_schedule_data: empty device_data -> None, and a malformed payload -> None
 * is_on: pending state surfaces while server hasn't caught up (return path)
 * async_turn_on: empty current_schedules early-return
 * async_turn_off: missing schedule_data key + empty list early-returns
@@ -302,9 +302,9 @@ def test_schedule_get_schedule_data_returns_none_when_device_empty() -> None:
 
 
 def test_schedule_get_schedule_data_swallows_exception() -> None:
-    """A broken schedule payload is caught and yields None (debug-logged)."""
+    """A broken (non-dict) device payload yields None instead of raising."""
     switch = _schedule([SCHEDULE_4])
-    # device_data raises when iterated/accessed -> exception handler -> None.
+    # device_data is not a dict -> rejected by the lookup -> None.
     bad = MagicMock()
     bad.__contains__.side_effect = TypeError("broken schedule payload")
     with patch.object(type(switch), "device_data", new_callable=lambda: property(lambda self: bad)):
@@ -344,6 +344,24 @@ async def test_schedule_turn_on_api_raises_is_swallowed() -> None:
     assert switch._pending_state is None
 
 
+@pytest.mark.parametrize(("enabled", "method"), [(True, "async_turn_on"), (False, "async_turn_off")])
+async def test_schedule_skips_write_when_slot_already_in_requested_state(enabled: bool, method: str) -> None:
+    """A redundant toggle must not resend the whole schedule list."""
+    switch = _schedule([{**SCHEDULE_4, "enabled": enabled}])
+    await getattr(switch, method)()
+    switch._api.set_schedule.assert_not_awaited()
+    assert switch._pending_state is None
+
+
+async def test_schedule_repeat_tap_while_pending_is_not_resent() -> None:
+    """A second "on" while the first one is still unconfirmed must not write again."""
+    switch = _schedule([SCHEDULE_4])  # server still reports disabled
+    switch._set_pending_state(True)
+    await switch.async_turn_on()
+    switch._api.set_schedule.assert_not_awaited()
+    assert switch._pending_state is True
+
+
 async def test_schedule_turn_off_missing_schedule_data_key_early_return() -> None:
     """No schedule_data key at all -> no API call, pending cleared."""
     switch = _schedule([])
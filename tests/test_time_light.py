@@ -500,9 +500,9 @@ def test_get_schedule_data_returns_none_when_device_absent() -> None:
 
 
 def test_get_schedule_data_swallows_iteration_error() -> None:
-    """A non-iterable schedule_data is caught and yields None (no exception)."""
+    """A non-list schedule_data is treated as no schedule and yields None."""
     device = _light_device([SCHEDULE])
-    device["schedule_data"] = 123  # not iterable -> TypeError caught internally
+    device["schedule_data"] = 123  # not a list -> ignored
     entity = FluidraLightScheduleEndTimeEntity(_coord(device), _api(), POOL_ID, LIGHT_ID, "1")
     _attach_ha(entity)
     assert entity._get_schedule_data() is None
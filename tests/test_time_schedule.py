@@ -456,6 +456,50 @@ async def test_start_time_set_value_allows_non_overlapping_change() -> None:
     api.set_schedule.assert_awaited_once()
 
 
+async def test_end_time_set_value_rejects_overlap_with_other_enabled_schedule() -> None:
+    """The end-time entity validates the (current start, new end) window."""
+    schedules = [
+        {
+            "id": 1,
+            "enabled": True,
+            "startTime": "0 12 * * 1,2,3,4,5",
+            "endTime": "0 13 * * 1,2,3,4,5",
+            "startActions": {"operationName": "1"},
+        },
+        {
+            "id": 2,
+            "enabled": True,
+            "startTime": "0 10 * * 1,2,3,4,5",
+            "endTime": "0 11 * * 1,2,3,4,5",
+            "startActions": {"operationName": "1"},
+        },
+    ]
+    device = _pump_device(schedules)
+    api = _api()
+    entity = FluidraScheduleEndTimeEntity(_coord(device), api, POOL_ID, PUMP_ID, schedule_id="2")
+    _attach_ha(entity)
+
+    # Stretching slot 2 to 10:00-12:30 runs into slot 1's 12:00-13:00.
+    with pytest.raises(ServiceValidationError):
+        await entity.async_set_value(time(12, 30))
+
+    assert entity._optimistic_value is None
+    api.set_schedule.assert_not_called()
+
+
+async def test_set_value_unchanged_time_is_not_sent() -> None:
+    """Re-sending the stored time skips validation and the API write."""
+    device = _pump_device([{**SCHEDULE, "id": 1, "startTime": "0 8 * * 1,2,3,4,5"}])
+    api = _api()
+    entity = FluidraScheduleStartTimeEntity(_coord(device), api, POOL_ID, PUMP_ID, schedule_id="1")
+    _attach_ha(entity)
+
+    await entity.async_set_value(time(8, 0))
+
+    api.set_schedule.assert_not_called()
+    assert entity._optimistic_value is None
+
+
 # --- _times_overlap helper directly --------------------------------------
 
 
@@ -24,6 +24,11 @@ def test_convert_cron_days_sorts_output() -> None:
     assert convert_cron_days("30 18 * * 5,0,2") == "30 18 * * 2,5,7"
 
 
+def test_convert_cron_days_keeps_mobile_format_days() -> None:
+    """Days already in mobile format (7 = Sunday) keep their value and are sorted."""
+    assert convert_cron_days("00 08 * * 7,1") == "00 08 * * 1,7"
+
+
 @pytest.mark.parametrize("empty", ["", None])
 def test_convert_cron_days_empty_returns_default(empty) -> None:
     """An empty CRON expression falls back to the all-days default."""